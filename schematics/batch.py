@@ -0,0 +1,236 @@
+# encoding=utf-8
+
+import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .types.base import IntType, FloatType
+from .exceptions import BaseError, ModelConversionError, ModelValidationError
+from .serialize import wholelist
+from .datastructures import OrderedDict
+
+
+# Field types whose converted values can be packed into an ``array.array``
+ARRAY_TYPECODES = (
+    (IntType, 'l'),
+    (FloatType, 'd'),
+)
+
+
+def _typecode(field):
+    for field_class, typecode in ARRAY_TYPECODES:
+        if isinstance(field, field_class):
+            return typecode
+    return None
+
+
+class ModelBatch(object):
+    """A columnar container for many rows of the same model.
+
+    Instead of holding one ``Model`` instance (and its data dicts) per row,
+    every field of the model is stored as a single column. Columns start out
+    as plain lists; after :meth:`convert` dense numeric columns are packed
+    into ``array.array`` instances. Rows are only materialized as ``Model``
+    instances when they are accessed.
+
+    >>> batch = ModelBatch(Person, [{'name': 'Arthur', 'age': 42}])
+    >>> batch.convert()
+    >>> batch.column('age')
+    array('l', [42])
+    >>> batch[0].name
+    u'Arthur'
+
+    :param model_class:
+        The ``Model`` subclass describing the rows.
+    :param rows:
+        An optional iterable of dicts or model instances to start with.
+    """
+
+    def __init__(self, model_class, rows=None):
+        self.model_class = model_class
+        self.columns = OrderedDict(
+            (field_name, []) for field_name in model_class._fields)
+        self.converted = False
+        self._length = 0
+        if rows:
+            self.extend(rows)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for index in xrange(self._length):
+            yield self.row(index)
+
+    def __getitem__(self, index):
+        return self.row(index)
+
+    def __repr__(self):
+        return '<%s of %s: %d rows>' % (self.__class__.__name__,
+                                         self.model_class.__name__, len(self))
+
+    def append(self, row):
+        """Adds a row given as a ``dict`` or a model instance. Values are
+        looked up by serialized name first and field name second, the same
+        way ``Model.convert`` does.
+        """
+        is_model = isinstance(row, self.model_class)
+        names = self.model_class._wire_names
+
+        for field_name, field in self.model_class._fields.iteritems():
+            if is_model:
+                value = row.get(field_name)
+            else:
+                serialized_name = names[field_name].name
+                if serialized_name in row:
+                    value = row[serialized_name]
+                else:
+                    value = row.get(field_name, field.default)
+            self._append_value(field_name, value)
+
+        self.converted = self.converted and is_model
+        self._length += 1
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def column(self, field_name, as_numpy=False):
+        """Returns the storage of a single column.
+
+        :param as_numpy:
+            Return the column as a NumPy array. Packed numeric columns are
+            wrapped without copying. Requires NumPy.
+        """
+        column = self.columns[field_name]
+        if as_numpy:
+            if numpy is None:
+                raise ImportError('Returning NumPy columns requires numpy.')
+            if isinstance(column, array.array):
+                return numpy.frombuffer(column, dtype=column.typecode)
+            return numpy.array(column, dtype=object)
+        return column
+
+    def row(self, index):
+        """Materializes the row at ``index`` as a model instance."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('batch index out of range')
+
+        instance = self.model_class()
+        instance._raw_data = dict(
+            (field_name, column[index])
+            for field_name, column in self.columns.iteritems())
+        instance._raw_converted = self.converted
+        return instance
+
+    def convert(self):
+        """Converts every column with its field's ``convert`` method and packs
+        numeric columns without ``None`` values into ``array.array``.
+
+        Raises ``ModelConversionError`` with errors keyed by row index.
+        """
+        errors = {}
+        names = self.model_class._wire_names
+        self._unpack_columns()
+
+        for field_name, field in self.model_class._fields.iteritems():
+            serialized_name = names[field_name].name
+            column = self.columns[field_name]
+
+            for index, value in enumerate(column):
+                if value is None:
+                    continue
+                try:
+                    column[index] = field.convert(value)
+                except BaseError as e:
+                    errors.setdefault(index, {})[serialized_name] = e.messages
+
+        if errors:
+            raise ModelConversionError(errors)
+
+        self._pack_columns()
+        self.converted = True
+
+    def validate(self, partial=False):
+        """Validates the converted columns with the field validators.
+
+        Raises ``ModelValidationError`` with errors keyed by row index.
+
+        :param partial:
+            Allow missing required values. Default: False
+        """
+        if not self.converted:
+            self.convert()
+
+        errors = {}
+        names = self.model_class._wire_names
+
+        for field_name, field in self.model_class._fields.iteritems():
+            serialized_name = names[field_name].name
+
+            for index, value in enumerate(self.columns[field_name]):
+                if value is None:
+                    if field.required and not partial:
+                        errors.setdefault(index, {})[serialized_name] = [
+                            field.messages['required']]
+                    continue
+                try:
+                    field.validate(value)
+                except BaseError as e:
+                    errors.setdefault(index, {})[serialized_name] = e.messages
+
+        if errors:
+            raise ModelValidationError(errors)
+
+    def serialize(self, role=None):
+        """Returns a list with the serialized form of every row."""
+        return [instance.serialize(role) for instance in self]
+
+    def to_columns(self, role=None):
+        """Returns a flat ``dict`` mapping serialized names to lists of
+        primitive values. Fields are converted column by column.
+        """
+        cls = self.model_class
+        gottago = wholelist()
+        if role in cls._options.roles:
+            gottago = cls._options.roles[role]
+
+        data = {}
+        names = cls._wire_names
+        for field_name, field in cls._fields.iteritems():
+            if gottago(field_name, None):
+                continue
+            to_primitive = field.to_primitive
+            data[names[field_name].name] = [
+                None if value is None else to_primitive(value)
+                for value in self.columns[field_name]]
+        return data
+
+    def _pack_columns(self):
+        for field_name, field in self.model_class._fields.iteritems():
+            typecode = _typecode(field)
+            column = self.columns[field_name]
+            if typecode is None or isinstance(column, array.array):
+                continue
+            try:
+                self.columns[field_name] = array.array(typecode, column)
+            except (TypeError, OverflowError):
+                pass  # None values or out of range, keep the list
+
+    def _append_value(self, field_name, value):
+        column = self.columns[field_name]
+        try:
+            column.append(value)
+        except (TypeError, OverflowError):
+            column = self.columns[field_name] = column.tolist()
+            column.append(value)
+
+    def _unpack_columns(self):
+        for field_name, column in self.columns.iteritems():
+            if isinstance(column, array.array):
+                self.columns[field_name] = column.tolist()
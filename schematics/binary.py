@@ -0,0 +1,447 @@
+# encoding=utf-8
+"""
+A compact binary serialization for models. Since the fields of a model have
+a fixed order, records are written positionally without any key names:
+
+* a bitmap marking which fields are ``None``
+* the values of all other fields, each encoded according to its type
+
+A serialized model starts with a format version and a fingerprint of the
+model's schema, so data written for an incompatible version of a model is
+rejected instead of being misread.
+
+>>> data = dumps(player)
+>>> loads(Player, data) == player
+True
+"""
+
+import datetime
+import decimal
+import json
+import struct
+import uuid
+import zlib
+
+from .types.base import (
+    BaseType, IntType, LongType, FloatType, BooleanType, StringType,
+    DateType, DateTimeType, UUIDType, UUIDBytes, DecimalType, HashType,
+    fixed_offset,
+)
+from .types.compound import ModelType, ListType, DictType
+from .exceptions import IncompatibleSchemaError
+
+
+FORMAT_VERSION = 1
+
+_header = struct.Struct('>BI')
+_double = struct.Struct('>d')
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+
+###
+### Primitive encodings
+###
+
+def _write_uint(out, value):
+    chunks = []
+    while value > 0x7f:
+        chunks.append(chr((value & 0x7f) | 0x80))
+        value >>= 7
+    chunks.append(chr(value))
+    out.append(''.join(chunks))
+
+
+def _read_uint(data, pos):
+    result = shift = 0
+    while True:
+        byte = ord(data[pos])
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _write_int(out, value):
+    # zigzag encoding keeps small negative numbers short
+    _write_uint(out, value * 2 if value >= 0 else -value * 2 - 1)
+
+
+def _read_int(data, pos):
+    value, pos = _read_uint(data, pos)
+    return (value >> 1) ^ -(value & 1), pos
+
+
+def _write_bytes(out, value):
+    _write_uint(out, len(value))
+    out.append(value)
+
+
+def _read_bytes(data, pos):
+    length, pos = _read_uint(data, pos)
+    end = pos + length
+    return data[pos:end], end
+
+
+def _write_text(out, value):
+    if isinstance(value, unicode):
+        value = value.encode('utf-8')
+    _write_bytes(out, value)
+
+
+def _read_text(data, pos):
+    value, pos = _read_bytes(data, pos)
+    return value.decode('utf-8'), pos
+
+
+###
+### Field codecs
+###
+
+def _int_codec(field):
+    return _write_int, _read_int
+
+
+def _uint_codec(field):
+    return _write_uint, _read_uint
+
+
+def _float_codec(field):
+    def write(out, value):
+        out.append(_double.pack(value))
+
+    def read(data, pos):
+        return _double.unpack_from(data, pos)[0], pos + 8
+
+    return write, read
+
+
+def _boolean_codec(field):
+    def write(out, value):
+        out.append('\x01' if value else '\x00')
+
+    def read(data, pos):
+        return data[pos] == '\x01', pos + 1
+
+    return write, read
+
+
+def _string_codec(field):
+    return _write_text, _read_text
+
+
+def _date_codec(field):
+    def write(out, value):
+        _write_int(out, value.toordinal())
+
+    def read(data, pos):
+        ordinal, pos = _read_int(data, pos)
+        return datetime.date.fromordinal(ordinal), pos
+
+    return write, read
+
+
+def _datetime_codec(field):
+    # Microseconds since the epoch of the wall clock time, then the UTC
+    # offset in minutes for aware datetimes
+    def write(out, value):
+        offset = value.utcoffset()
+        delta = value.replace(tzinfo=None) - EPOCH
+        _write_int(out, (delta.days * 86400 + delta.seconds) * 1000000 +
+                   delta.microseconds)
+        if offset is None:
+            out.append('\x00')
+        else:
+            out.append('\x01')
+            _write_int(out, offset.days * 1440 + offset.seconds // 60)
+
+    def read(data, pos):
+        microseconds, pos = _read_int(data, pos)
+        value = EPOCH + datetime.timedelta(microseconds=microseconds)
+        pos += 1
+        if data[pos - 1] == '\x01':
+            minutes, pos = _read_int(data, pos)
+            value = value.replace(tzinfo=fixed_offset(minutes))
+        return value, pos
+
+    return write, read
+
+
+def _uuid_codec(field):
+    def write(out, value):
+        out.append(value if isinstance(value, str) else value.bytes)
+
+    def read(data, pos):
+        value = UUIDBytes(data[pos:pos + 16])
+        if not field.compact:
+            value = uuid.UUID(bytes=value)
+        return value, pos + 16
+
+    return write, read
+
+
+def _decimal_codec(field):
+    # Sign, exponent and coefficient of finite values, the string form of
+    # infinities and NaNs
+    def write(out, value):
+        sign, digits, exponent = value.as_tuple()
+        if isinstance(exponent, int):
+            out.append('\x01' if sign else '\x00')
+            _write_int(out, exponent)
+            _write_uint(out, int(''.join(map(str, digits)) or 0))
+        else:
+            out.append('\x02')
+            _write_bytes(out, str(value))
+
+    def read(data, pos):
+        kind = data[pos]
+        pos += 1
+        if kind == '\x02':
+            value, pos = _read_bytes(data, pos)
+            return decimal.Decimal(value), pos
+        exponent, pos = _read_int(data, pos)
+        coefficient, pos = _read_uint(data, pos)
+        digits = tuple(map(int, str(coefficient)))
+        return decimal.Decimal((kind == '\x01', digits, exponent)), pos
+
+    return write, read
+
+
+def _model_codec(field):
+    def write(out, value):
+        _write_record(out, field.model_class, value)
+
+    def read(data, pos):
+        return _read_record(data, pos, field.model_class)
+
+    return write, read
+
+
+def _list_codec(field):
+    write_item, read_item = codec(field.field)
+
+    def write(out, value):
+        _write_uint(out, len(value))
+        for item in value:
+            if item is None:
+                out.append('\x00')
+            else:
+                out.append('\x01')
+                write_item(out, item)
+
+    def read(data, pos):
+        length, pos = _read_uint(data, pos)
+        items = []
+        for _ in xrange(length):
+            pos += 1
+            if data[pos - 1] == '\x00':
+                items.append(None)
+            else:
+                item, pos = read_item(data, pos)
+                items.append(item)
+        return items, pos
+
+    return write, read
+
+
+def _dict_codec(field):
+    write_item, read_item = codec(field.field)
+    coerce_key = field.coerce
+    wire_key = field.wire_key
+
+    def write(out, value):
+        _write_uint(out, len(value))
+        for key, item in value.iteritems():
+            _write_text(out, wire_key(key))
+            if item is None:
+                out.append('\x00')
+            else:
+                out.append('\x01')
+                write_item(out, item)
+
+    def read(data, pos):
+        length, pos = _read_uint(data, pos)
+        items = {}
+        for _ in xrange(length):
+            key, pos = _read_text(data, pos)
+            pos += 1
+            if data[pos - 1] == '\x00':
+                item = None
+            else:
+                item, pos = read_item(data, pos)
+            items[coerce_key(key)] = item
+        return items, pos
+
+    return write, read
+
+
+def _json_codec(field):
+    # Types without a dedicated encoding are stored as JSON of their
+    # primitive form and converted back when read
+    def write(out, value):
+        _write_bytes(out, json.dumps(field.to_primitive(value)))
+
+    def read(data, pos):
+        value, pos = _read_bytes(data, pos)
+        return field.convert(json.loads(value)), pos
+
+    return write, read
+
+
+# Checked in order, so subclasses have to come before their bases
+CODECS = (
+    (ModelType, _model_codec),
+    (ListType, _list_codec),
+    (DictType, _dict_codec),
+    (DateTimeType, _datetime_codec),
+    (DateType, _date_codec),
+    (UUIDType, _uuid_codec),
+    (DecimalType, _decimal_codec),
+    (BooleanType, _boolean_codec),
+    (IntType, _int_codec),
+    (LongType, _int_codec),
+    (HashType, _uint_codec),
+    (FloatType, _float_codec),
+    (StringType, _string_codec),
+    (BaseType, _json_codec),
+)
+
+
+def codec(field):
+    """Returns the ``(write, read)`` functions encoding values of ``field``."""
+    for field_class, factory in CODECS:
+        if isinstance(field, field_class):
+            return factory(field)
+    raise TypeError('No binary encoding for %r' % field)
+
+
+###
+### Records
+###
+
+_schemas = {}
+
+
+def _schema(model_class):
+    """Returns the fingerprint and the codecs of the fields of a model class.
+    Both are cached until the field table of the class or of one of its
+    nested models is replaced.
+    """
+    entry = _schemas.get(model_class)
+    if entry is None or not all(cls._fields is fields for cls, fields in entry[0]):
+        tables = {}
+        value = _fingerprint(model_class, tables)
+        # the field tables are read before the codecs are built, so a table
+        # replaced in between is noticed the next time
+        codecs = [(field_name,) + codec(field)
+                  for field_name, field in tables[model_class].iteritems()]
+        entry = (tables.items(), value, codecs)
+        _schemas[model_class] = entry
+    return entry[1], entry[2]
+
+
+def schema_fingerprint(model_class):
+    """Returns the :func:`fingerprint` of ``model_class``, cached until the
+    field table of the class or of one of its nested models is replaced.
+    """
+    return _schema(model_class)[0]
+
+
+def _describe_fields(model_class, path, tables):
+    fields = tables[model_class] = model_class._fields
+    path = path + (model_class,)
+    return ','.join('%s:%s' % (name, _describe(field, path, tables))
+                    for name, field in fields.iteritems())
+
+
+def _describe(field, path, tables):
+    # path holds the model classes being described, outermost first
+    description = type(field).__name__
+    if isinstance(field, ModelType):
+        if field.model_class in path:
+            # a model nesting itself refers back to the enclosing description
+            description += '(^%d)' % path.index(field.model_class)
+        else:
+            description += '(%s)' % _describe_fields(field.model_class, path,
+                                                     tables)
+    elif isinstance(field, (ListType, DictType)):
+        description += '(%s)' % _describe(field.field, path, tables)
+    elif isinstance(field, UUIDType) and field.compact:
+        description += '(compact)'
+    return description
+
+
+def _fingerprint(model_class, tables):
+    # tables collects the field table of every model class described
+    description = _describe_fields(model_class, (), tables)
+    return zlib.crc32(description) & 0xffffffff
+
+
+def fingerprint(model_class):
+    """Returns a 32 bit fingerprint of the names, order and types of the
+    fields of ``model_class``, including nested models.
+    """
+    return _fingerprint(model_class, {})
+
+
+def _write_record(out, model_class, instance):
+    codecs = _schema(model_class)[1]
+    values = [instance[field_name] for field_name, _, _ in codecs]
+
+    bitmap = bytearray((len(values) + 7) // 8)
+    for index, value in enumerate(values):
+        if value is None:
+            bitmap[index >> 3] |= 1 << (index & 7)
+    out.append(str(bitmap))
+
+    for (field_name, write, _), value in zip(codecs, values):
+        if value is not None:
+            write(out, value)
+
+
+def _read_record(data, pos, model_class):
+    codecs = _schema(model_class)[1]
+
+    bitmap_end = pos + (len(codecs) + 7) // 8
+    bitmap = bytearray(data[pos:bitmap_end])
+    pos = bitmap_end
+
+    values = {}
+    for index, (field_name, _, read) in enumerate(codecs):
+        if bitmap[index >> 3] & (1 << (index & 7)):
+            values[field_name] = None
+        else:
+            values[field_name], pos = read(data, pos)
+
+    # The values were converted when they were written
+    instance = model_class()
+    instance._raw_data = values
+    instance._raw_converted = True
+    return instance, pos
+
+
+def dumps(instance):
+    """Serializes a model instance to a compact binary ``str``."""
+    model_class = type(instance)
+    out = [_header.pack(FORMAT_VERSION, schema_fingerprint(model_class))]
+    _write_record(out, model_class, instance)
+    return ''.join(out)
+
+
+def loads(model_class, data):
+    """Reads a model instance written by :func:`dumps` for ``model_class``.
+
+    Raises ``IncompatibleSchemaError`` if the data was written with another
+    version of the format or for a model with different fields.
+    """
+    version, data_fingerprint = _header.unpack_from(data)
+    if version != FORMAT_VERSION:
+        raise IncompatibleSchemaError(
+            'Unsupported binary format version %d' % version)
+    if data_fingerprint != schema_fingerprint(model_class):
+        raise IncompatibleSchemaError(
+            'Data was not written for the fields of %s' % model_class.__name__)
+
+    instance, _ = _read_record(data, _header.size, model_class)
+    return instance
@@ -101,7 +101,8 @@ class OrderedDict(dict):
         return d
 
     def __reduce__(self):
-        return type(self), self.items()
+        # the pickler sets the items one by one, keeping their order
+        return type(self), (), None, None, self.iteritems()
 
     def __reversed__(self):
         return reversed(self._keys)
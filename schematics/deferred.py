@@ -0,0 +1,91 @@
+import threading
+
+
+def is_pending(value):
+    """Tells whether a validator returned a future instead of finishing its
+    check. Any object with ``add_done_callback`` and ``result`` methods counts,
+    such as the futures of ``concurrent.futures``, Tornado or :class:`Future`.
+    """
+    return (callable(getattr(value, 'add_done_callback', None)) and
+            callable(getattr(value, 'result', None)))
+
+
+class Future(object):
+    """A minimal thread-safe future, returned by the asynchronous validation
+    API. It follows the ``concurrent.futures.Future`` interface for
+    ``result``, ``exception``, ``done`` and ``add_done_callback``.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._done = False
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+
+    def done(self):
+        return self._done
+
+    def result(self, timeout=None):
+        self._wait(timeout)
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self, timeout=None):
+        self._wait(timeout)
+        return self._exception
+
+    def add_done_callback(self, fn):
+        with self._condition:
+            if not self._done:
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def set_result(self, result):
+        self._finish(result, None)
+
+    def set_exception(self, exception):
+        self._finish(None, exception)
+
+    def _wait(self, timeout):
+        with self._condition:
+            if timeout is None:
+                while not self._done:
+                    self._condition.wait()
+            elif not self._done:
+                self._condition.wait(timeout)
+            if not self._done:
+                raise RuntimeError('Future is not done')
+
+    def _finish(self, result, exception):
+        with self._condition:
+            if self._done:
+                raise RuntimeError('Future is already done')
+            self._result, self._exception = result, exception
+            self._done = True
+            callbacks, self._callbacks = self._callbacks, []
+            self._condition.notify_all()
+        for fn in callbacks:
+            fn(self)
+
+
+def gather(futures, callback):
+    """Calls ``callback`` once every future in ``futures`` is done, from
+    whichever thread finishes the last one.
+    """
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def on_done(_):
+        with lock:
+            remaining[0] -= 1
+            finished = remaining[0] == 0
+        if finished:
+            callback()
+
+    if not futures:
+        callback()
+    for future in futures:
+        future.add_done_callback(on_done)
@@ -46,3 +46,9 @@ class ModelValidationError(ValidationError):
 class StopValidation(ValidationError):
     """Exception raised when no more validation need occur."""
     pass
+
+
+class IncompatibleSchemaError(ValueError):
+    """Exception raised when serialized data was written for a different
+    version of a model's schema."""
+    pass
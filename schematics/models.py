@@ -1,15 +1,24 @@
 # encoding=utf-8
 
+import collections
 import inspect
 import itertools
 
 from .types import BaseType
-from .types.compound import ModelType
+from .types.compound import ModelType, checking_nested_models
 from .types.serializable import Serializable
-from .exceptions import BaseError, ValidationError, ModelValidationError, ConversionError, ModelConversionError
-from .serialize import atoms, serialize, flatten, expand
-from .validate import validate
+from .exceptions import (
+    BaseError, ValidationError, ModelValidationError, ConversionError,
+    ModelConversionError, IncompatibleSchemaError,
+)
+from .serialize import (
+    atoms, serialize, flatten, expand, to_json, wire_names, WireNames,
+)
+from .validate import validate, validate_async
+from .deferred import Future
 from .datastructures import OrderedDict as OrderedDictWithSort
+from .binary import schema_fingerprint
+from .schema import ModelSchema
 
 
 class FieldDescriptor(object):
@@ -32,7 +41,95 @@ class FieldDescriptor(object):
         if self.name not in model._fields:
             raise AttributeError('%r has no attribute %r' %
                                  (type(model).__name__, self.name))
-        del model._fields[self.name]
+        # copy-on-write, see ModelMeta.append_field
+        fields = model._fields.copy()
+        del fields[self.name]
+        set_field_plan(type(model), fields, model._wire_names)
+        type(model)._fields = fields
+        type(model)._schema = ModelSchema(type(model))
+
+
+def set_field_plan(cls, fields, names):
+    """Sets ``cls._plan`` to ``(field name, serialized name, field)`` for
+    each of ``fields`` in order, and ``cls._field_keys`` to the set of names
+    input for the fields may be found under. Conversion and validation walk
+    the plan, which is replaced along with the field table, instead of
+    looking up the serialized name of every field for every instance.
+    """
+    plan = tuple((field_name, names[field_name].name, field)
+                 for field_name, field in fields.iteritems())
+    cls._field_keys = frozenset(name for field_name, serialized_name, _ in plan
+                                for name in (field_name, serialized_name))
+    cls._plan = plan
+
+
+class ModelState(object):
+    """A read-only stand-in for a model instance whose field values come from
+    ``data``. Lets ``Model.serialize`` work on freshly validated data without
+    storing it on the instance.
+    """
+
+    def __init__(self, instance, data):
+        self.instance = instance
+        self.data = data
+        self._fields = instance._fields
+        self._serializables = instance._serializables
+        self._options = instance._options
+        self._wire_names = instance._wire_names
+
+    def __getitem__(self, name):
+        try:
+            return self.data[name]
+        except KeyError:
+            if name in self._fields:
+                return self._fields[name].default
+            return self.instance[name]
+
+
+class ModelView(collections.Mapping):
+    """The raw data of an instance created by ``Model.view``. Values are read
+    from the wrapped mapping by serialized name or field name and converted
+    the first time they are accessed. Assigning values is not supported.
+    """
+
+    def __init__(self, model_class, mapping):
+        self.model_class = model_class
+        self.mapping = mapping
+        self._converted = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._converted[name]
+        except KeyError:
+            pass
+
+        cls = self.model_class
+        field = cls._fields[name]
+        serialized_name = cls._wire_names[name].name
+        if serialized_name in self.mapping:
+            value = self.mapping[serialized_name]
+        else:
+            value = self.mapping.get(name, field.default)
+
+        if value is not None:
+            if isinstance(field, ModelType) and not isinstance(value, Model):
+                value = field.model_class.view(value)
+            else:
+                value = field.convert(value)
+        self._converted[name] = value
+        return value
+
+    def __setitem__(self, name, value):
+        raise TypeError('%s views are read-only' % self.model_class.__name__)
+
+    def __contains__(self, name):
+        return name in self.model_class._fields
+
+    def __iter__(self):
+        return iter(self.model_class._fields)
+
+    def __len__(self):
+        return len(self.model_class._fields)
 
 
 class ModelOptions(object):
@@ -48,12 +145,17 @@ class ModelOptions(object):
         serialization.
     :param serialize_when_none:
         When ``False``, serialization skips fields that are None. Default: ``True``
+    :param check_trusted:
+        When ``True``, ``Model.from_trusted`` checks that the values it is
+        given are converted already. Meant for debugging. Default: ``False``
     """
-    def __init__(self, klass, namespace=None, roles=None, serialize_when_none=True):
+    def __init__(self, klass, namespace=None, roles=None, serialize_when_none=True,
+                 check_trusted=False):
         self.klass = klass
         self.namespace = namespace
         self.roles = roles or {}
         self.serialize_when_none = serialize_when_none
+        self.check_trusted = check_trusted
 
     def _copy(self):
         return ModelOptions(self.klass, self.namespace, self.roles.copy())
@@ -77,7 +179,8 @@ class ModelMeta(type):
                 validator_functions.update(base._validator_functions)
 
         for key, value in attrs.iteritems():
-            if key.startswith('validate_') and callable(value):
+            # Model.validate_async is a method, not a validator for "async"
+            if key.startswith('validate_') and callable(value) and key != 'validate_async':
                 validator_functions[key[9:]] = value
             if isinstance(value, BaseType):
                 fields[key] = value
@@ -98,6 +201,13 @@ class ModelMeta(type):
 
         klass = type.__new__(cls, name, bases, attrs)
 
+        # Serialized names of fields and serializables, computed once per
+        # class since the same field may be bound under different names
+        klass._wire_names = WireNames(
+            klass, dict(wire_names(fields), **wire_names(serializables)))
+        set_field_plan(klass, fields, klass._wire_names)
+        klass._schema = ModelSchema(klass)
+
         for field in fields.values():
             field.owner_model = klass
 
@@ -128,9 +238,20 @@ class ModelMeta(type):
         return options_class(cls, **options_members)
 
     def append_field(cls, name, field):
+        """Adds a field to the model class. The field table is replaced
+        instead of changed in place, so code iterating over the fields in
+        another thread keeps working with a consistent snapshot.
+        """
         if isinstance(field, BaseType):
-            cls._fields[name] = field
+            fields = cls._fields.copy()
+            fields[name] = field
+            names = WireNames(cls, cls._wire_names)
+            names.update(wire_names({name: field}))
             setattr(cls, name, FieldDescriptor(name))
+            cls._wire_names = names
+            set_field_plan(cls, fields, names)
+            cls._fields = fields
+            cls._schema = ModelSchema(cls)
         else:
             raise TypeError('field must be of type %s' % BaseType)
 
@@ -159,6 +280,10 @@ class Model(object):
     __metaclass__ = ModelMeta
     __optionsclass__ = ModelOptions
 
+    # True while the values of _raw_data under field names are the output of
+    # convert, so validation doesn't need to convert them again
+    _raw_converted = False
+
     @classmethod
     def get_role(cls, role_name):
         return cls._options.roles.get(role_name)
@@ -167,14 +292,84 @@ class Model(object):
     def from_flat(cls, data):
         return cls(expand(data))
 
+    @classmethod
+    def view(cls, mapping):
+        """Returns an instance that reads its values from ``mapping`` without
+        copying it. Values are converted when they are read and are not
+        validated, so only use it for trusted data. The instance is
+        read-only; ``serialize`` reads straight from the mapping.
+
+        :param mapping:
+            A ``dict`` or other mapping keyed by serialized names or field
+            names.
+        """
+        instance = cls()
+        instance._raw_data = ModelView(cls, mapping)
+        return instance
+
+    @classmethod
+    def from_trusted(cls, data, check=None):
+        """Creates an instance from values that are converted and validated
+        already, like the data of another instance. The values are stored as
+        validated data without calling ``convert`` or any validators. Nested
+        models may be given as instances or as dicts of trusted values.
+
+        :param data:
+            A ``dict`` keyed by field name. Other keys are ignored.
+        :param check:
+            Check that the values are converted, raising
+            ``ModelConversionError`` otherwise. Defaults to the
+            ``check_trusted`` option of the model.
+        """
+        if check is None:
+            check = cls._options.check_trusted
+        fields = cls._fields
+        names = cls._wire_names
+        trusted = {}
+        errors = {}
+
+        for field_name, value in data.iteritems():
+            field = fields.get(field_name)
+            if field is None:
+                if check:
+                    errors[field_name] = [u'%s is an illegal field.' % field_name]
+                continue
+            try:
+                trusted[field_name] = field.trusted(value, check)
+            except ConversionError, e:
+                errors[names[field_name].name] = e.messages
+
+        if errors:
+            raise ModelConversionError(errors)
+
+        instance = cls()
+        instance._data = trusted
+        return instance
+
+    @classmethod
+    def construct(cls, **values):
+        """Like :meth:`from_trusted` with the values as keyword arguments.
+
+        >>> Player.construct(id=1, name=u'Arthur')
+        """
+        return cls.from_trusted(values)
+
     def __init__(self, raw_data=None):
         self._raw_data = {}
         self._data = {}
         if raw_data:
             converted = self.convert(raw_data)
-            self._raw_data = dict(raw_data, **converted)
-
-    def validate(self, raw_data=None, partial=False, strict=False):
+            # keep other input, like values of serializables, without
+            # copying the converted values once more
+            if isinstance(raw_data, dict):
+                field_keys = self._field_keys
+                for key, value in raw_data.iteritems():
+                    if key not in field_keys:
+                        converted[key] = value
+            self._raw_data = converted
+            self._raw_converted = True
+
+    def validate(self, raw_data=None, partial=False, strict=False, sample=None):
         """
         Validates the state of the model and adding additional untrusted data
         as well. If the models is invalid, raises ValidationError with error messages.
@@ -187,19 +382,75 @@ class Model(object):
             definitions. Default: False
         :param strict:
             Complain about unrecognized keys. Default: False
+        :param sample:
+            A :class:`schematics.sampling.Sample` picking the items of
+            ``ListType`` and ``DictType`` fields to check instead of all of
+            them. Its ``checked`` attribute tells which items were checked.
         """
         if raw_data:
+            self._raw_converted = False
+            self._raw_data = dict(self._raw_data)
             self._raw_data.update(raw_data)
         if not self._raw_data and partial:
             return  # no input data to validate
         try:
-            data = validate(self, self._raw_data, partial=partial, strict=strict, context=self._data)
-            self._data.update(data)
+            # the validated data replaces _data as a whole, so readers never
+            # see it half updated
+            self._data = validate(self, self._raw_data, partial=partial, strict=strict,
+                                  context=self._data, sample=sample,
+                                  converted=self._raw_converted)
         except BaseError as e:
             raise ModelValidationError(e.messages)
         finally:
             # input data was processed, clear it
             self._raw_data = {}
+            self._raw_converted = False
+
+    def validate_async(self, raw_data=None, partial=False, strict=False, sample=None):
+        """
+        Like :meth:`validate`, but field validators and ``validate_<field>``
+        methods may return futures for checks doing I/O. Those of all fields
+        run concurrently and a :class:`schematics.deferred.Future` is
+        returned, which resolves to ``None`` once the model is updated or fails
+        with ``ModelValidationError``. Validators that don't return futures
+        run right away.
+
+        Accepts the same arguments as :meth:`validate`.
+        """
+        if raw_data:
+            self._raw_converted = False
+            self._raw_data = dict(self._raw_data)
+            self._raw_data.update(raw_data)
+        result = Future()
+        if not self._raw_data and partial:
+            result.set_result(None)
+            return result  # no input data to validate
+        try:
+            validation = validate_async(self, self._raw_data, partial=partial,
+                                        strict=strict, context=self._data,
+                                        sample=sample, converted=self._raw_converted)
+        except BaseError as e:
+            result.set_exception(ModelValidationError(e.messages))
+            return result
+        finally:
+            # input data was processed, clear it
+            self._raw_data = {}
+            self._raw_converted = False
+
+        def done(validation):
+            try:
+                data = dict(self._data)
+                data.update(validation.result())
+                self._data = data
+            except BaseError as e:
+                result.set_exception(ModelValidationError(e.messages))
+            except Exception as e:
+                result.set_exception(e)
+            else:
+                result.set_result(None)
+
+        validation.add_done_callback(done)
+        return result
 
     def serialize(self, role=None):
         """Return data as it would be validated. No filtering of output unless
@@ -209,14 +460,49 @@ class Model(object):
             Filter output by a specific role
 
         """
+        return serialize(self._serializable_state(), role)
+
+    def to_json(self, role=None, stream=None):
+        """Return data as JSON, the same as ``json.dumps(self.serialize(role))``
+        but written in one pass over the fields.
+
+        :param role:
+            Filter output by a specific role
+        :param stream:
+            A file-like object to write to. If not given the JSON is returned
+            as a ``str``.
+
+        """
+        return to_json(self._serializable_state(), role, stream)
+
+    def _check(self, partial=False):
+        # Like validate() without storing the validated data, for models
+        # other threads may be reading. Nested models are checked the same
+        # way.
+        raw_data = self._raw_data
+        if not raw_data and partial:
+            return
         try:
-            raw_data = self._raw_data
-            self.validate(partial=True)
-        except ModelValidationError:
-            pass
-        data = serialize(self, role)
-        self._raw_data = raw_data
-        return data
+            with checking_nested_models():
+                validate(self, raw_data, partial=partial, context=self._data,
+                         converted=self._raw_converted)
+        except BaseError as e:
+            raise ModelValidationError(e.messages)
+
+    def _serializable_state(self):
+        data = self._data
+        if isinstance(self._raw_data, ModelView):
+            data = self._raw_data
+        elif self._raw_data:
+            try:
+                # serializing doesn't change the instance or nested models,
+                # which other threads may be reading
+                with checking_nested_models():
+                    data = validate(self, self._raw_data, partial=True, context=data,
+                                    converted=self._raw_converted)
+            except BaseError:
+                pass
+        return ModelState(self, data)
 
     def flatten(self, role=None, prefix=""):
         """
@@ -244,21 +530,18 @@ class Model(object):
             error_msg = 'Model conversion requires a model or dict'
             raise ModelConversionError(error_msg)
 
-        for field_name, field in self._fields.iteritems():
-            serialized_field_name = field.serialized_name or field_name
+        for field_name, serialized_field_name, field in self._plan:
+            if serialized_field_name in raw_data:
+                raw_value = raw_data[serialized_field_name]
+            elif field_name in raw_data:
+                raw_value = raw_data[field_name]
+            else:
+                raw_value = field.default
 
             try:
-                if serialized_field_name in raw_data:
-                    raw_value = raw_data[serialized_field_name]
-                else:
-                    raw_value = raw_data[field_name]
-
                 if raw_value is not None:
                     raw_value = field.convert(raw_value)
                 data[field_name] = raw_value
-
-            except KeyError:
-                data[field_name] = field.default
             except ConversionError, e:
                 errors[serialized_field_name] = e.messages
 
@@ -267,6 +550,60 @@ class Model(object):
 
         return data
 
+    def __reduce__(self):
+        return type(self), (), self.__getstate__()
+
+    def __getstate__(self):
+        """Returns the state of the instance for pickling: the schema
+        fingerprint of the class, then for both the validated and the raw data
+        a bitmask of the fields that are set and a tuple of their values in
+        field order, then any raw data for unknown keys and finally whether
+        the raw data is converted. Field names aren't stored.
+        """
+        fields = self._fields
+        state = [schema_fingerprint(self.__class__)]
+        for data in (self._data, self._raw_data):
+            mask = 0
+            values = []
+            for index, field_name in enumerate(fields):
+                if field_name in data:
+                    mask |= 1 << index
+                    values.append(data[field_name])
+            state.append(mask)
+            state.append(tuple(values))
+
+        # raw input under serialized names was converted to the field names
+        # already, anything else is kept as is
+        known = set(fields)
+        known.update(name.name for name in self._wire_names.itervalues())
+        extra = dict((k, v) for k, v in self._raw_data.iteritems()
+                     if k not in known)
+        state.append(extra or None)
+        state.append(self._raw_converted)
+        return tuple(state)
+
+    def __setstate__(self, state):
+        """Restores the data written by :meth:`__getstate__` without
+        converting it again.
+        """
+        fingerprint, data_mask, data_values, raw_mask, raw_values, extra = state[:6]
+        if fingerprint != schema_fingerprint(self.__class__):
+            raise IncompatibleSchemaError(
+                'Pickled data was not written for the fields of %s' %
+                self.__class__.__name__)
+
+        field_names = self._fields.keys()
+        self._data = dict(zip(
+            (name for index, name in enumerate(field_names) if data_mask >> index & 1),
+            data_values))
+        self._raw_data = dict(zip(
+            (name for index, name in enumerate(field_names) if raw_mask >> index & 1),
+            raw_values))
+        if extra:
+            self._raw_data.update(extra)
+        # older pickles don't say whether the raw data is converted
+        self._raw_converted = len(state) > 6 and state[6]
+
     def __iter__(self):
         return self.iter()
 
@@ -292,14 +629,19 @@ class Model(object):
             return default
 
     def __getitem__(self, name):
-        if name in self._raw_data:
-            return self._raw_data[name]
-        elif name in self._data:
-            return self._data[name]
+        # validate() replaces both dicts, _data first, so look them up once
+        # and in this order to never see the new _raw_data with the old _data
+        raw_data = self._raw_data
+        data = self._data
+        if name in raw_data:
+            return raw_data[name]
+        elif name in data:
+            return data[name]
         elif name in self._fields:
-            default = self._fields[name].default
-            self._raw_data[name] = default
-            return default
+            # unlike Model.convert this doesn't convert the default, so the
+            # raw data no longer counts as converted
+            self._raw_converted = False
+            return raw_data.setdefault(name, self._fields[name].default)
         else:
             try:
                 return getattr(self, name)
@@ -322,6 +664,7 @@ class Model(object):
                 value = field.model_class(value)
             # TODO: read Options class for strict type checking flag
             #self._raw_data[name] = field(value)
+            self._raw_converted = False
             self._raw_data[name] = value
             return
         # check serializables
@@ -0,0 +1,74 @@
+# encoding=utf-8
+
+import random as random_module
+
+
+class Sample(object):
+    """Picks the items of large collections that are validated, for trusted
+    data where checking every item costs more than it is worth. Pass it to
+    ``ListType`` or ``DictType`` as ``sample``, or to ``Model.validate`` to
+    sample all collection fields of a model.
+
+    Strategies can be combined; an item is checked if any of them picks it.
+
+    >>> sample = Sample(first=10, random=100, seed=7)
+    >>> player.validate(sample=sample)
+    >>> sample.checked[Player.scores]
+    [0, 1, 2, ...]
+
+    :param first:
+        Check the first ``first`` items.
+    :param random:
+        Check ``random`` items picked at random.
+    :param every:
+        Check every ``every``-th item, starting with the first.
+    :param seed:
+        Seed for picking random items. Collections of the same length get
+        the same items picked. Default: 0
+
+    At least one of ``first``, ``random`` and ``every`` must be given, and
+    they must be positive.
+
+    :ivar checked:
+        The indices of the list items, or the keys of the dict items, that
+        were checked by the last validation of each field, keyed by field.
+    """
+
+    def __init__(self, first=None, random=None, every=None, seed=0):
+        strategies = dict(first=first, random=random, every=every)
+        if all(value is None for value in strategies.itervalues()):
+            raise ValueError('Sample needs first, random or every')
+        for name, value in sorted(strategies.iteritems()):
+            if value is not None and value <= 0:
+                raise ValueError('Sample %s must be positive, not %r' % (name, value))
+        self.first = first
+        self.random = random
+        self.every = every
+        self.seed = seed
+        self.checked = {}
+
+    def __repr__(self):
+        return '<Sample first=%r random=%r every=%r seed=%r>' % (
+            self.first, self.random, self.every, self.seed)
+
+    def indices(self, length):
+        """Returns the sorted indices picked from a sequence of ``length``."""
+        picked = set()
+        if self.first:
+            picked.update(xrange(min(self.first, length)))
+        if self.every:
+            picked.update(xrange(0, length, self.every))
+        if self.random:
+            rng = random_module.Random(self.seed)
+            picked.update(rng.sample(xrange(length), min(self.random, length)))
+        return sorted(picked)
+
+    def pick(self, items):
+        """Returns the picked indices of a list, or keys of a dict. Keys are
+        picked from the sorted keys, so the same keys are picked no matter
+        how the dict was built.
+        """
+        if isinstance(items, dict):
+            keys = sorted(items)
+            return [keys[index] for index in self.indices(len(keys))]
+        return self.indices(len(items))
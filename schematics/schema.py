@@ -0,0 +1,244 @@
+# encoding=utf-8
+"""
+Precomputed descriptions of the fields of models, for tooling that needs to
+know the structure of a model without walking its field objects, and an
+exporter of JSON Schema built on them.
+
+Every model class holds a :class:`ModelSchema` built by its metaclass and
+replaced along with the field table, so it's never out of date.
+
+>>> schema = describe(Player)
+>>> schema['name'].constraints
+{'max_length': 40}
+>>> to_jsonschema(Player)['properties']['name']['maxLength']
+40
+"""
+
+from .datastructures import OrderedDict
+
+
+JSONSCHEMA_DRAFT = 'http://json-schema.org/draft-04/schema#'
+
+# Field attributes copied into ``FieldSchema.constraints`` and the JSON
+# Schema keywords they become
+CONSTRAINTS = (
+    ('min_length', 'minLength'),
+    ('max_length', 'maxLength'),
+    ('regex', 'pattern'),
+    ('min_value', 'minimum'),
+    ('max_value', 'maximum'),
+    ('min_size', 'minItems'),
+    ('max_size', 'maxItems'),
+)
+
+# minimum and maximum only apply to numbers in JSON Schema, and decimals
+# are serialized as strings or as minor units
+_NUMERIC_KEYWORDS = ('minimum', 'maximum')
+
+
+class FieldSchema(object):
+    """The description of a single field.
+
+    :ivar name:
+        The name of the field on the model, ``None`` for the items of lists
+        and dicts.
+    :ivar serialized_name:
+        The key of the field in serialized data.
+    :ivar type:
+        The name of the field class, like ``'StringType'``.
+    :ivar json_type:
+        The JSON Schema type of the primitive values, or ``None`` if the
+        values may have any type.
+    :ivar json_format:
+        The JSON Schema format of the primitive values, or ``None``.
+    :ivar required:
+        Whether the field is required.
+    :ivar choices:
+        A list of the valid values, or ``None``.
+    :ivar constraints:
+        A ``dict`` of the length, size and range limits and the regular
+        expression pattern of the field, leaving out the ones that aren't
+        set.
+    :ivar item:
+        The ``FieldSchema`` of the items of list and dict fields.
+    :ivar model_class:
+        The nested model class of model fields.
+    """
+
+    __slots__ = ('name', 'serialized_name', 'type', 'json_type', 'json_format',
+                 'required', 'choices', 'constraints', 'item', 'model_class')
+
+    def __init__(self, field, name=None, serialized_name=None):
+        self.name = name
+        self.serialized_name = serialized_name
+        self.type = type(field).__name__
+        self.json_type = field._jsonschema_type()
+        self.json_format = field._jsonschema_format()
+        self.required = bool(field.required)
+        self.choices = list(field.choices) if field.choices is not None else None
+
+        self.constraints = {}
+        for attribute, _ in CONSTRAINTS:
+            value = getattr(field, attribute, None)
+            if value is not None:
+                if attribute == 'regex':
+                    value = value.pattern
+                self.constraints[attribute] = value
+
+        item = getattr(field, 'field', None)
+        self.item = FieldSchema(item) if item is not None else None
+        # lists and dicts of models have a model_class too, which is their
+        # items' to describe
+        self.model_class = field.model_class if self.item is None and \
+            hasattr(field, 'model_class') else None
+
+    def __repr__(self):
+        return '<%s %s: %s>' % (self.__class__.__name__,
+                                self.name or 'item', self.type)
+
+
+class ModelSchema(object):
+    """The descriptions of the fields and serializables of a model class,
+    in field order. Available as ``Model._schema`` and through
+    :func:`describe`.
+
+    The JSON Schema of the model is built when it's first asked for and kept
+    until the schema of the model or of one of its nested models is
+    replaced.
+    """
+
+    def __init__(self, model_class):
+        self.model_class = model_class
+        names = model_class._wire_names
+        self.fields = tuple(
+            FieldSchema(field, field_name, serialized_name)
+            for field_name, serialized_name, field in model_class._plan)
+        self.serializables = tuple(
+            FieldSchema(serializable.type, name, names[name].name)
+            for name, serializable in sorted(model_class._serializables.iteritems()))
+        self._by_name = dict((field.name, field)
+                             for field in self.fields + self.serializables)
+        self._jsonschema = None
+
+    def __getitem__(self, name):
+        return self._by_name[name]
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __repr__(self):
+        return '<%s of %s>' % (self.__class__.__name__, self.model_class.__name__)
+
+    def jsonschema(self):
+        """Returns the JSON Schema of the serialized form of the model as a
+        ``dict``. The same ``dict`` is returned until the model changes, so
+        callers must copy it before changing it.
+        """
+        cached = self._jsonschema
+        if cached is not None and all(model_class._schema is schema
+                                      for model_class, schema in cached[0]):
+            return cached[1]
+
+        builder = _JSONSchemaBuilder(self.model_class)
+        result = builder.root()
+        self._jsonschema = (builder.schemas, result)
+        return result
+
+
+class _JSONSchemaBuilder(object):
+    # Nested models are put under "definitions" once and referenced, which
+    # also takes care of models nesting themselves
+
+    def __init__(self, model_class):
+        self.model_class = model_class
+        self.definitions = OrderedDict()
+        self.refs = {model_class: '#'}
+        self.schemas = [(model_class, model_class._schema)]
+
+    def root(self):
+        result = OrderedDict([('$schema', JSONSCHEMA_DRAFT),
+                              ('title', self.model_class.__name__)])
+        result.update(self.model(self.model_class._schema))
+        if self.definitions:
+            result['definitions'] = self.definitions
+        return result
+
+    def model(self, schema):
+        properties = OrderedDict()
+        for field in schema.fields + schema.serializables:
+            properties[field.serialized_name] = self.field(field)
+
+        result = OrderedDict([('type', 'object'), ('properties', properties)])
+        required = [field.serialized_name for field in schema.fields
+                    if field.required]
+        if required:
+            result['required'] = required
+        return result
+
+    def ref(self, model_class):
+        if model_class not in self.refs:
+            name = model_class.__name__
+            while name in self.definitions:
+                name += '_'
+            self.refs[model_class] = '#/definitions/%s' % name
+            self.schemas.append((model_class, model_class._schema))
+            self.definitions[name] = None  # reserves the name while nesting
+            self.definitions[name] = self.model(model_class._schema)
+        return {'$ref': self.refs[model_class]}
+
+    def field(self, field):
+        if field.model_class is not None:
+            result = self.ref(field.model_class)
+            if not field.required:
+                result = {'anyOf': [result, {'type': 'null'}]}
+            return result
+
+        result = OrderedDict()
+        if field.json_type is not None:
+            result['type'] = field.json_type
+            if not field.required:
+                result['type'] = [field.json_type, 'null']
+        if field.json_format is not None:
+            result['format'] = field.json_format
+        if field.choices is not None:
+            result['enum'] = field.choices
+
+        for attribute, keyword in CONSTRAINTS:
+            if attribute not in field.constraints:
+                continue
+            value = field.constraints[attribute]
+            if keyword in _NUMERIC_KEYWORDS and (
+                    field.json_type not in ('integer', 'number') or
+                    not isinstance(value, (int, long, float))):
+                continue
+            if keyword == 'pattern':
+                # fields match at the start of the value, JSON Schema
+                # patterns anywhere
+                value = '^(?:%s)' % value
+            result[keyword] = value
+
+        if field.item is not None:
+            if field.json_type == 'array':
+                result['items'] = self.field(field.item)
+            else:
+                result['additionalProperties'] = self.field(field.item)
+        return result
+
+
+def describe(model_class):
+    """Returns the :class:`ModelSchema` of ``model_class``."""
+    return model_class._schema
+
+
+def to_jsonschema(model_class):
+    """Returns the JSON Schema (draft 4) of the serialized form of
+    ``model_class`` as a ``dict``, with nested models under
+    ``"definitions"``.
+    """
+    return model_class._schema.jsonschema()
@@ -1,10 +1,13 @@
 # encoding=utf-8
 
 from .types.compound import (
-    ModelType, EMPTY_LIST, EMPTY_DICT, MultiType
+    ModelType, ListType, EMPTY_LIST, EMPTY_DICT, MultiType
 )
 import collections
 import itertools
+import json
+from cStringIO import StringIO
+from json.encoder import encode_basestring_ascii
 
 
 ###
@@ -168,9 +171,10 @@ def apply_shape(cls, instance_or_dict, role, field_converter, model_converter,
         raise ValueError(error_msg % (cls, role))
 
     ### Transformation loop
+    names = cls._wire_names
     attr_gen = atoms(cls, instance_or_dict, include_serializables, gottago)
     for field_name, field, value in attr_gen:
-        serialized_name = field.serialized_name or field_name
+        serialized_name = names[field_name].name
 
         ### Value found, convert and store it.
         if value is not None:
@@ -215,6 +219,157 @@ def serialize(instance, role, raise_error_on_role=True):
     return data
 
 
+_json_encode = json.JSONEncoder(separators=(',', ':')).encode
+
+_json_keys = {}
+
+
+def json_key(name):
+    """Returns ``name`` as a quoted JSON object key followed by a colon. The
+    result is cached since the same few field names are written over and over.
+    """
+    try:
+        return _json_keys[name]
+    except KeyError:
+        key = _json_keys[name] = encode_basestring_ascii(name) + ':'
+        return key
+
+
+class WireName(object):
+    """The name of a field in serialized data, precomputed in the forms
+    encoders need when the field is bound to a model.
+
+    :ivar name: The name as given, interned if it is a ``str``.
+    :ivar text: The name as ``unicode``.
+    :ivar bytes: The name encoded as UTF-8.
+    :ivar json: The name as a quoted JSON object key followed by a colon.
+    """
+
+    __slots__ = ('name', 'text', 'bytes', 'json')
+
+    def __init__(self, name):
+        if isinstance(name, str):
+            self.name = intern(name)
+            self.text = name.decode('utf-8')
+        else:
+            self.name = self.text = name
+        self.bytes = self.text.encode('utf-8')
+        self.json = json_key(self.text)
+
+    def __repr__(self):
+        return '<WireName %r>' % self.name
+
+
+def wire_names(fields):
+    """Maps the names of ``fields`` to their :class:`WireName`."""
+    return dict((field_name, WireName(field.serialized_name or field_name))
+                for field_name, field in fields.iteritems())
+
+
+class WireNames(dict):
+    """The :class:`WireName` of every field and serializable of a model
+    class, keyed by field name.
+
+    ``append_field`` replaces the table of a class, so code that looked up
+    the table before a field was added may meet the field afterwards. Its
+    name is then computed from the class instead of raising ``KeyError``.
+    """
+
+    def __init__(self, model_class, names):
+        dict.__init__(self, names)
+        self.model_class = model_class
+
+    def __missing__(self, field_name):
+        cls = self.model_class
+        field = cls._fields.get(field_name)
+        if field is None:
+            field = cls._serializables.get(field_name)
+            if field is None:
+                raise KeyError(field_name)
+        return WireName(field.serialized_name or field_name)
+
+
+def json_value(value):
+    if isinstance(value, basestring):
+        return encode_basestring_ascii(value)
+    return _json_encode(value)
+
+
+def to_json(instance, role, stream=None, raise_error_on_role=True):
+    """
+    Writes the JSON for ``serialize(instance, role)`` to ``stream`` in one
+    walk over the fields, without building the whole primitive ``dict``
+    first. Items of ``ListType`` fields are converted and written one at a
+    time.
+
+    Returns the JSON as a ``str`` if no stream is given.
+    """
+    output = stream if stream is not None else StringIO()
+    write = output.write
+
+    gottago = wholelist()
+    if role in instance._options.roles:
+        gottago = instance._options.roles[role]
+    elif role and raise_error_on_role:
+        error_msg = u'%s has no role "%s"'
+        raise ValueError(error_msg % (instance, role))
+
+    names = instance._wire_names
+    write('{')
+    separator = ''
+    for field_name, field, value in atoms(instance, instance, True, gottago):
+        key = names[field_name].json
+
+        if value is None:
+            if allow_none(instance, field):
+                write(separator + key + 'null')
+                separator = ','
+            continue
+
+        if isinstance(field, ListType):
+            write(separator + key)
+            _write_list(field, value, role, write)
+            separator = ','
+            continue
+
+        if isinstance(field, ModelType):
+            primitive_value = field.to_primitive(value, raise_error_on_role)
+            primitive_value = field.filter_by_role(value, primitive_value, role)
+        elif isinstance(field, MultiType):
+            primitive_value = field.to_primitive(value)
+            primitive_value = field.filter_by_role(value, primitive_value, role,
+                                                   raise_error_on_role=raise_error_on_role)
+        else:
+            primitive_value = field.to_primitive(value)
+
+        if primitive_value is not None or allow_none(instance, field):
+            write(separator + key + json_value(primitive_value))
+            separator = ','
+    write('}')
+
+    if stream is None:
+        return output.getvalue()
+
+
+def _write_list(field, items, role, write):
+    item_field = field.field
+    is_multi = isinstance(item_field, MultiType)
+
+    write('[')
+    separator = ''
+    for item in items:
+        primitive_value = item_field.to_primitive(item)
+        if is_multi:
+            # filter a single item list to apply the same rules as for
+            # the whole list without building it
+            filtered = field.filter_by_role([item], [primitive_value], role)
+            if not filtered:
+                continue
+        write(separator + json_value(primitive_value))
+        separator = ','
+    write(']')
+
+
 def expand(data, context=None):
     expanded_dict = {}
 
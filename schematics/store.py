@@ -0,0 +1,261 @@
+# encoding=utf-8
+"""
+A file of fixed-schema records that readers map into memory. Records are
+appended with the encodings of :mod:`schematics.binary`, each preceded by a
+table with the offset of every field, so a single field of a record can be
+decoded without reading the rest of it.
+
+>>> with RecordStore(Player, 'players.db', 'a') as store:
+...     store.append(player)
+0
+>>> store = RecordStore(Player, 'players.db')
+>>> store.field(0, 'name')
+u'Arthur'
+>>> store[0].level
+4
+
+The file starts with a header holding the schema fingerprint of the model,
+followed by the records::
+
+    length of the record body   4 bytes
+    offset table                4 bytes per field, relative to the body
+    field values                ...
+
+Fields that are ``None`` have an offset of ``0xffffffff``.
+"""
+
+import collections
+import mmap
+import os
+import struct
+
+from .binary import _schema
+from .exceptions import IncompatibleSchemaError
+
+
+MAGIC = 'SCHR'
+FORMAT_VERSION = 1
+
+NONE_OFFSET = 0xffffffff
+
+_header = struct.Struct('>4sBIH')
+_length = struct.Struct('>I')
+
+
+class RecordView(collections.MutableMapping):
+    """The field values of one record, decoded when they are first accessed.
+
+    Used as the raw data of the instances returned by ``RecordStore``, so
+    reading an attribute only decodes that field. Values assigned later are
+    kept in the view and never written back to the store.
+    """
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+        self._keys = set(store.model_class._fields)
+        self._values = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            if key not in self._keys:
+                raise
+            value = self._values[key] = self._store.field(self._index, key)
+            return value
+
+    def __setitem__(self, key, value):
+        self._keys.add(key)
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        self._keys.remove(key)
+        self._values.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class RecordStore(object):
+    """Appends model instances to a file and reads them back through a
+    read-only memory map, which is shared by all processes reading the file.
+
+    :param model_class:
+        The ``Model`` subclass of the records.
+    :param path:
+        The file of the store. Created in mode ``'a'`` if it doesn't exist.
+    :param mode:
+        ``'r'`` to only read, ``'a'`` to also append. Default: ``'r'``
+    """
+
+    def __init__(self, model_class, path, mode='r'):
+        if mode not in ('r', 'a'):
+            raise ValueError("mode must be 'r' or 'a', not %r" % mode)
+        self.model_class = model_class
+        self.path = path
+        self.mode = mode
+
+        fingerprint, codecs = _schema(model_class)
+        self._fingerprint = fingerprint
+        self._codecs = codecs
+        self._field_indexes = dict(
+            (field_name, index) for index, (field_name, _, _) in enumerate(codecs))
+        self._table = struct.Struct('>%dI' % len(codecs))
+
+        self._file = open(path, 'a+b' if mode == 'a' else 'rb')
+        self._map = None
+        self._size = 0
+        self._offsets = []
+
+        if mode == 'a' and os.fstat(self._file.fileno()).st_size == 0:
+            self._file.write(_header.pack(MAGIC, FORMAT_VERSION, fingerprint,
+                                          len(codecs)))
+            self._file.flush()
+        self.refresh()
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        """Returns the record at ``index`` as a model instance whose values
+        are decoded from the mapped file on access.
+        """
+        self._locate(index)
+        instance = self.model_class()
+        instance._raw_data = RecordView(self, index % len(self._offsets))
+        # the values were converted when they were appended
+        instance._raw_converted = True
+        return instance
+
+    def __iter__(self):
+        for index in xrange(len(self._offsets)):
+            yield self[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return '<%s of %s: %d records>' % (self.__class__.__name__,
+                                            self.model_class.__name__, len(self))
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def refresh(self):
+        """Maps records appended to the file since the store was opened or
+        last refreshed, possibly by another process. Records that are still
+        being written are skipped.
+        """
+        size = os.fstat(self._file.fileno()).st_size
+        if size == self._size or size < _header.size:
+            return  # nothing new, or the header isn't written yet
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+
+        if not self._size:
+            self._check_header()
+            self._size = _header.size
+        pos = self._size
+
+        # pos stays at the start of an incomplete record, if any
+        while pos + _length.size <= size:
+            end = pos + _length.size + _length.unpack_from(self._map, pos)[0]
+            if end > size:
+                break
+            self._offsets.append(pos + _length.size)
+            pos = end
+        self._size = pos
+
+    def append(self, instance):
+        """Writes ``instance`` at the end of the store and returns its index.
+        """
+        return self.extend([instance])
+
+    def extend(self, instances):
+        """Writes several instances with a single write and returns the index
+        of the last one.
+        """
+        if self.mode != 'a':
+            raise IOError('%s was not opened for appending' % self.path)
+        records = [self._encode(instance) for instance in instances]
+        if records:
+            self._file.seek(0, os.SEEK_END)
+            self._file.write(''.join(records))
+            self._file.flush()
+            self.refresh()
+        return len(self._offsets) - 1
+
+    def field(self, index, field_name):
+        """Decodes a single field of the record at ``index``."""
+        start = self._locate(index)
+        position = self._field_indexes[field_name]
+        offset = _length.unpack_from(self._map, start + 4 * position)[0]
+        if offset == NONE_OFFSET:
+            return None
+        read = self._codecs[position][2]
+        return read(self._map, start + offset)[0]
+
+    def row(self, index):
+        """Decodes all fields of the record at ``index`` into a ``dict``."""
+        start = self._locate(index)
+        offsets = self._table.unpack_from(self._map, start)
+        row = {}
+        for (field_name, _, read), offset in zip(self._codecs, offsets):
+            if offset == NONE_OFFSET:
+                row[field_name] = None
+            else:
+                row[field_name] = read(self._map, start + offset)[0]
+        return row
+
+    def _check_header(self):
+        magic, version, fingerprint, _ = _header.unpack_from(self._map)
+        if magic != MAGIC:
+            raise IncompatibleSchemaError('%s is not a record store' % self.path)
+        if version != FORMAT_VERSION:
+            raise IncompatibleSchemaError(
+                'Unsupported record store version %d' % version)
+        if fingerprint != self._fingerprint:
+            raise IncompatibleSchemaError(
+                '%s was not written for the fields of %s' %
+                (self.path, self.model_class.__name__))
+
+    def _locate(self, index):
+        try:
+            return self._offsets[index]
+        except IndexError:
+            raise IndexError('record index out of range')
+
+    def _encode(self, instance):
+        # offsets are relative to the start of the body, which begins with
+        # the offset table itself
+        offsets = []
+        out = []
+        position = self._table.size
+        for field_name, write, _ in self._codecs:
+            value = instance[field_name]
+            if value is None:
+                offsets.append(NONE_OFFSET)
+                continue
+            offsets.append(position)
+            encoded = []
+            write(encoded, value)
+            encoded = ''.join(encoded)
+            out.append(encoded)
+            position += len(encoded)
+
+        body = self._table.pack(*offsets) + ''.join(out)
+        return _length.pack(len(body)) + body
@@ -1,11 +1,14 @@
 import uuid
 import re
+import string
+import binascii
 import datetime
 import decimal
 import itertools
 import functools
 
 from ..exceptions import StopValidation, ValidationError, ConversionError
+from ..deferred import is_pending
 
 
 def force_unicode(obj, encoding='utf-8'):
@@ -18,6 +21,135 @@ def force_unicode(obj, encoding='utf-8'):
     return obj
 
 
+ZERO_TIMEDELTA = datetime.timedelta(0)
+
+
+class FixedOffset(datetime.tzinfo):
+    """A ``tzinfo`` with a fixed offset from UTC given in minutes. Instances
+    are cached per offset by :func:`fixed_offset`.
+    """
+
+    def __init__(self, minutes):
+        self._offset = datetime.timedelta(minutes=minutes)
+        if minutes:
+            sign = '-' if minutes < 0 else '+'
+            self._name = '%s%02d:%02d' % ((sign,) + divmod(abs(minutes), 60))
+        else:
+            self._name = 'UTC'
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def dst(self, dt):
+        return ZERO_TIMEDELTA
+
+    def tzname(self, dt):
+        return self._name
+
+    def __reduce__(self):
+        return fixed_offset, (self._offset.days * 1440 + self._offset.seconds // 60,)
+
+    def __repr__(self):
+        return '<FixedOffset %s>' % self._name
+
+
+_fixed_offsets = {}
+
+
+def fixed_offset(minutes):
+    try:
+        return _fixed_offsets[minutes]
+    except KeyError:
+        return _fixed_offsets.setdefault(minutes, FixedOffset(minutes))
+
+
+UTC = fixed_offset(0)
+
+ISO_DATE_REGEX = re.compile(r'(\d{4})-(\d\d)-(\d\d)$')
+
+ISO_DATETIME_REGEX = re.compile(
+    r'(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?'
+    r'(?:(Z)|([+-])(\d\d):?(\d\d))?$'
+)
+
+
+def parse_iso_date(value):
+    """Parses a ``YYYY-MM-DD`` string. Returns ``None`` if the value doesn't
+    match, raises ``ValueError`` if it matches but isn't a valid date.
+    """
+    match = ISO_DATE_REGEX.match(value)
+    if match is None:
+        return None
+    year, month, day = match.groups()
+    return datetime.date(int(year), int(month), int(day))
+
+
+def parse_iso_datetime(value):
+    """Parses an ISO-8601 datetime string with optional fractional seconds and
+    an optional ``Z`` or ``+HH:MM`` timezone designator. Returns ``None`` if
+    the value doesn't match, raises ``ValueError`` if it matches but isn't a
+    valid datetime.
+    """
+    match = ISO_DATETIME_REGEX.match(value)
+    if match is None:
+        return None
+    (year, month, day, hour, minute, second, fraction,
+     zulu, sign, offset_hours, offset_minutes) = match.groups()
+
+    microsecond = int(fraction.ljust(6, '0')) if fraction else 0
+
+    tzinfo = None
+    if zulu:
+        tzinfo = UTC
+    elif sign:
+        if int(offset_hours) > 23 or int(offset_minutes) > 59:
+            raise ValueError('UTC offset out of range: %s' % value)
+        minutes = int(offset_hours) * 60 + int(offset_minutes)
+        tzinfo = fixed_offset(-minutes if sign == '-' else minutes)
+
+    return datetime.datetime(int(year), int(month), int(day), int(hour),
+                             int(minute), int(second), microsecond, tzinfo)
+
+
+ISO_DATE_CACHE_SIZE = 1024
+
+_iso_date_cache = {}
+
+
+def format_iso_date(value):
+    """Formats a date or datetime as ``YYYY-MM-DD``. Results are memoized per
+    day since serialized data tends to repeat the same dates.
+    """
+    key = value.toordinal()
+    try:
+        return _iso_date_cache[key]
+    except KeyError:
+        if len(_iso_date_cache) >= ISO_DATE_CACHE_SIZE:
+            _iso_date_cache.clear()
+        formatted = '%04d-%02d-%02d' % (value.year, value.month, value.day)
+        _iso_date_cache[key] = formatted
+        return formatted
+
+
+def format_iso_datetime(value):
+    """Formats a datetime as ``YYYY-MM-DDTHH:MM:SS.ffffff``, the same output as
+    ``strftime`` with ``DateTimeType.SERIALIZED_FORMAT``. Aware datetimes get
+    their UTC offset appended as ``+HH:MM``, or ``Z`` for UTC, so they are
+    read back as the same instant.
+    """
+    formatted = '%sT%02d:%02d:%02d.%06d' % (format_iso_date(value), value.hour,
+                                            value.minute, value.second,
+                                            value.microsecond)
+    offset = value.utcoffset()
+    if offset is None:
+        return formatted
+    minutes = offset.days * 1440 + offset.seconds // 60
+    if not minutes:
+        return formatted + 'Z'
+    sign = '-' if minutes < 0 else '+'
+    return '%s%s%02d:%02d' % (formatted, sign, abs(minutes) // 60, abs(minutes) % 60)
+
+
 _last_position_hint = -1
 _next_position_hint = itertools.count().next
 
@@ -140,6 +272,55 @@ class BaseType(object):
         """
         return value
 
+    def _jsonschema_type(self):
+        return None
+
+    def _jsonschema_format(self):
+        return None
+
+    def trusted(self, value, check=False):
+        """Returns a value that was converted already, as used by
+        ``Model.from_trusted``.
+
+        :param check:
+            Raise ``ConversionError`` if ``convert`` would change the value
+            or its type, to catch data that isn't converted after all.
+        """
+        if check and value is not None:
+            converted = self.convert(value)
+            if type(converted) is not type(value) or converted != value:
+                raise ConversionError(
+                    u'Trusted value of type {} was not converted.'.format(
+                        type(value).__name__))
+        return value
+
+    def convert_many(self, values):
+        """
+        Convert a sequence of untrusted values in one pass. Raises
+        ``ConversionError`` with the errors keyed by index.
+        """
+        convert = self.convert
+        converted = []
+        errors = {}
+
+        for index, value in enumerate(values):
+            try:
+                converted.append(convert(value))
+            except (ConversionError, ValidationError), e:
+                errors[index] = e.messages
+
+        if errors:
+            raise ConversionError(errors)
+
+        return converted
+
+    def prefetch(self, values):
+        """
+        Called by collection types with all their values before validating
+        them one by one. Types whose validation does I/O can batch it here.
+        """
+        pass
+
     def validate(self, value, old_value=None):
         """
         Validate the field and return a clean value or raise a
@@ -147,22 +328,50 @@ class BaseType(object):
         chain. Stop the validation process from continuing through the
         validators by raising ``StopValidation`` instead of ``ValidationError``.
 
+        Validators doing I/O may return a future instead, which fails with a
+        ``ValidationError`` for invalid values. ``validate`` waits for them.
+
         """
 
         errors = []
 
+        for future in self.run_validators(value, old_value):
+            try:
+                future.result()
+            except ValidationError, e:
+                errors.extend(e.messages)
+
+        if errors:
+            raise ValidationError(errors)
+
+    def run_validators(self, value, old_value=None):
+        """
+        Run the validation chain without waiting for validators that return
+        a future. Raises ``ValidationError`` for the errors found so far and
+        returns the pending futures otherwise.
+
+        """
+
+        errors = []
+        pending = []
+
         for validator in self.validators:
             try:
-                validator(value, old_value)
+                result = validator(value, old_value)
             except ValidationError, e:
                 errors.extend(e.messages)
 
                 if isinstance(e, StopValidation):
                     break
+            else:
+                if is_pending(result):
+                    pending.append(result)
 
         if errors:
             raise ValidationError(errors)
 
+        return pending
+
     def validate_required(self, value, *args):
         if self.required and value is None:
             raise ValidationError(self.messages['required'])
@@ -174,23 +383,112 @@ class BaseType(object):
                     .format(unicode(self.choices)))
 
 
+_ipv4_networks = {}
+
+
+def uuid_bytes(value):
+    """Returns the 16 bytes of a UUID given as a ``uuid.UUID`` or in any string
+    form ``uuid.UUID`` accepts, without building a ``uuid.UUID``. Raises
+    ``ValueError`` for anything else.
+    """
+    if isinstance(value, uuid.UUID):
+        return value.bytes
+    try:
+        hex = value.replace('urn:', '').replace('uuid:', '')
+        hex = hex.strip('{}').replace('-', '')
+        if len(hex) == 32:
+            return binascii.unhexlify(hex)
+    except (AttributeError, TypeError, ValueError):
+        pass
+    raise ValueError('badly formed UUID string')
+
+
+class UUIDBytes(str):
+    """The 16 raw bytes of a UUID, as stored by ``UUIDType(compact=True)``.
+    Wrap bytes in it to pass them to such a field; a plain ``str`` of 16
+    characters is not taken for a UUID.
+    """
+
+    __slots__ = ()
+
+
 class UUIDType(BaseType):
     """A field that stores a valid UUID value.
+
+    :param compact:
+        Store values as ``UUIDBytes``, their 16 raw bytes, instead of
+        ``uuid.UUID`` instances. Default: False
     """
 
+    MESSAGES = {
+        'convert': u"Couldn't interpret value as UUID.",
+    }
+
+    def __init__(self, compact=False, **kwargs):
+        self.compact = compact
+        super(UUIDType, self).__init__(**kwargs)
+
+    def _jsonschema_type(self):
+        return 'string'
+
+    def _jsonschema_format(self):
+        return 'uuid'
+
     def convert(self, value):
+        if self.compact:
+            if isinstance(value, UUIDBytes):
+                return value
+            try:
+                return UUIDBytes(uuid_bytes(value))
+            except ValueError:
+                raise ConversionError(self.messages['convert'])
+
         if not isinstance(value, uuid.UUID):
-            value = uuid.UUID(value)
+            try:
+                value = uuid.UUID(value)
+            except (AttributeError, TypeError, ValueError):
+                raise ConversionError(self.messages['convert'])
         return value
 
     def to_primitive(self, value):
+        if self.compact:
+            hex = binascii.hexlify(value)
+            return '%s-%s-%s-%s-%s' % (hex[:8], hex[8:12], hex[12:16],
+                                       hex[16:20], hex[20:])
         return str(value)
 
+    @classmethod
+    def invalid_indices(cls, values):
+        """Returns the indices of the values that are not valid UUIDs."""
+        invalid = []
+        for index, value in enumerate(values):
+            try:
+                uuid_bytes(value)
+            except ValueError:
+                invalid.append(index)
+        return invalid
+
 
 class IPv4Type(BaseType):
-    """ A field that stores a valid IPv4 address """
+    """ A field that stores a valid IPv4 address
+
+    :param packed:
+        Store addresses as 32-bit integers instead of dotted strings. Packed
+        addresses are cheap to keep in memory and to compare, and are
+        serialized back to dotted form. Default: False
+    """
+
+    IPV4_REGEX = re.compile(
+        r'(?:(?:25[0-5]|2[0-4]\d|[01]?\d?\d)\.){3}'
+        r'(?:25[0-5]|2[0-4]\d|[01]?\d?\d)$'
+    )
+
+    MESSAGES = {
+        'ipv4': u"Invalid IPv4 address",
+    }
 
-    def __init__(self, auto_fill=False, **kwargs):
+    def __init__(self, auto_fill=False, packed=False, **kwargs):
+        self.packed = packed
         super(IPv4Type, self).__init__(**kwargs)
 
     def _jsonschema_type(self):
@@ -199,22 +497,61 @@ class IPv4Type(BaseType):
     @classmethod
     def valid_ip(cls, addr):
         try:
-            addr = addr.strip().split(".")
+            return cls.IPV4_REGEX.match(addr.strip()) is not None
         except AttributeError:
             return False
+
+    @classmethod
+    def ip_to_int(cls, addr):
+        """Packs a valid dotted IPv4 address into an integer."""
+        a, b, c, d = addr.strip().split('.')
+        return (int(a) << 24) | (int(b) << 16) | (int(c) << 8) | int(d)
+
+    @classmethod
+    def int_to_ip(cls, value):
+        """Unpacks an integer into a dotted IPv4 address."""
+        return u'%d.%d.%d.%d' % (value >> 24, (value >> 16) & 255,
+                                 (value >> 8) & 255, value & 255)
+
+    @classmethod
+    def in_network(cls, addr, cidr):
+        """Tells whether the address, dotted or packed, is inside the network
+        given in CIDR notation, e.g. ``'10.0.0.0/8'``.
+        """
         try:
-            return len(addr) == 4 and all(int(octet) < 256 for octet in addr)
-        except ValueError:
-            return False
+            network, mask = _ipv4_networks[cidr]
+        except KeyError:
+            network, _, prefix = cidr.partition('/')
+            prefix = int(prefix) if prefix else 32
+            mask = (0xffffffff << (32 - prefix)) & 0xffffffff
+            network = cls.ip_to_int(network) & mask
+            _ipv4_networks[cidr] = (network, mask)
+
+        if not isinstance(addr, (int, long)):
+            addr = cls.ip_to_int(addr)
+        return addr & mask == network
 
-    def validate(self, value, *args):
+    def convert(self, value):
+        if self.packed and isinstance(value, basestring) and self.valid_ip(value):
+            return self.ip_to_int(value)
+        return value
+
+    def to_primitive(self, value):
+        if self.packed and isinstance(value, (int, long)):
+            return self.int_to_ip(value)
+        return value
+
+    def validate_ipv4(self, value, *args):
         """
           Make sure the value is a IPv4 address:
           http://stackoverflow.com/questions/9948833/validate-ip-address-from-list
         """
-        if not IPv4Type.valid_ip(value):
-            error_msg = 'Invalid IPv4 address'
-            raise ValidationError(error_msg)
+        if self.packed and isinstance(value, (int, long)):
+            valid = 0 <= value <= 0xffffffff
+        else:
+            valid = IPv4Type.valid_ip(value)
+        if not valid:
+            raise ValidationError(self.messages['ipv4'])
         return True
 
     def _jsonschema_format(self):
@@ -250,6 +587,9 @@ class StringType(BaseType):
 
         super(StringType, self).__init__(**kwargs)
 
+    def _jsonschema_type(self):
+        return 'string'
+
     def convert(self, value):
         if value is None:
             return None
@@ -278,11 +618,36 @@ class StringType(BaseType):
             raise ValidationError(self.messages['regex'])
 
 
+DOMAIN_CACHE_SIZE = 1024
+
+_DOMAIN_PATTERN = r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?'
+
+_has_whitespace = re.compile(r'\s').search
+
+
+def _match_domain(cache, regex, domain):
+    """Matches ``domain`` against ``regex``, remembering the outcome in the
+    bounded ``cache`` dict since the same domains keep coming back.
+    """
+    try:
+        return cache[domain]
+    except KeyError:
+        if len(cache) >= DOMAIN_CACHE_SIZE:
+            cache.clear()
+        matched = cache[domain] = regex.match(domain) is not None
+        return matched
+
+
 class URLType(StringType):
     """A field that validates input as an URL.
 
     If verify_exists=True is passed the validate function will make sure
-    the URL makes a valid connection.
+    the URL makes a valid connection. Lists and dicts of URLs are checked
+    concurrently.
+
+    :param checker:
+        A ``schematics.types.urlcheck.URLChecker`` doing the existence checks.
+        Default: a shared checker sending ``HEAD`` requests.
     """
 
     MESSAGES = {
@@ -296,23 +661,72 @@ class URLType(StringType):
         r'localhost|'
         r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
         r'(?::\d+)?'
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE
+        r'(?:/?|[/?]\S+)\Z', re.IGNORECASE
     )
 
-    def __init__(self, verify_exists=False, **kwargs):
+    HOST_REGEX = re.compile(
+        r'(?:' + _DOMAIN_PATTERN + r'|'
+        r'localhost|'
+        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+        r'(?::\d+)?\Z', re.IGNORECASE
+    )
+
+    _host_cache = {}
+
+    def __init__(self, verify_exists=False, checker=None, **kwargs):
         self.verify_exists = verify_exists
+        self.checker = checker
         super(URLType, self).__init__(**kwargs)
 
+    def _jsonschema_format(self):
+        return 'uri'
+
+    def get_checker(self):
+        if self.checker is None:
+            from .urlcheck import default_checker
+            return default_checker
+        return self.checker
+
+    @classmethod
+    def valid_url(cls, value):
+        """Same outcome as matching ``URL_REGEX``. The scheme and path are
+        checked with string methods and the host against a cache of recently
+        seen hosts, so only new hosts go through a regex.
+        """
+        scheme = value[:8].lower()
+        if scheme.startswith('http://'):
+            rest = value[7:]
+        elif scheme == 'https://':
+            rest = value[8:]
+        else:
+            return False
+
+        end = len(rest)
+        for separator in '/?':
+            index = rest.find(separator, 0, end)
+            if index != -1:
+                end = index
+        host, path = rest[:end], rest[end:]
+
+        if len(path) > 1:
+            if _has_whitespace(path, 1):
+                return False
+        elif path == '?':
+            return False
+
+        return _match_domain(cls._host_cache, cls.HOST_REGEX, host)
+
     def validate_url(self, value, *args):
-        if not URLType.URL_REGEX.match(value):
+        if not self.valid_url(value):
             raise StopValidation(self.messages['invalid_url'])
+        if self.verify_exists and not self.get_checker().exists(value):
+            raise StopValidation(self.messages['not_found'])
+
+    def prefetch(self, values):
         if self.verify_exists:
-            import urllib2
-            try:
-                request = urllib2.Request(value)
-                urllib2.urlopen(request)
-            except Exception:
-                raise StopValidation(self.messages['not_found'])
+            self.get_checker().exists_many(
+                [value for value in values
+                 if isinstance(value, basestring) and self.valid_url(value)])
 
 
 class EmailType(StringType):
@@ -334,8 +748,35 @@ class EmailType(StringType):
         re.IGNORECASE
     )
 
+    DOT_ATOM_REGEX = re.compile(
+        r"[-!#$%&'*+/=?^_`{}|~0-9A-Z]+(\.[-!#$%&'*+/=?^_`{}|~0-9A-Z]+)*\Z",
+        re.IGNORECASE
+    )
+
+    DOMAIN_REGEX = re.compile(_DOMAIN_PATTERN + r'$', re.IGNORECASE)
+
+    _domain_cache = {}
+
+    def _jsonschema_format(self):
+        return 'email'
+
+    @classmethod
+    def valid_email(cls, value):
+        """Same outcome as matching ``EMAIL_REGEX``. Values without an ``@``
+        are rejected right away, plain local parts are checked with a simple
+        regex and domains against a cache of recently seen domains. Only
+        quoted local parts go through the full regex.
+        """
+        local, at, domain = value.rpartition('@')
+        if not at or not local:
+            return False
+        if local[0] == '"':
+            return EmailType.EMAIL_REGEX.match(value) is not None
+        return (cls.DOT_ATOM_REGEX.match(local) is not None and
+                _match_domain(cls._domain_cache, cls.DOMAIN_REGEX, domain))
+
     def validate_email(self, value, *args):
-        if not EmailType.EMAIL_REGEX.match(value):
+        if not self.valid_email(value):
             raise StopValidation(self.messages['email'])
 
 
@@ -358,6 +799,9 @@ class NumberType(BaseType):
 
         super(NumberType, self).__init__(**kwargs)
 
+    def _jsonschema_type(self):
+        return 'number' if self.number_class is float else 'integer'
+
     def convert(self, value):
         try:
             value = self.number_class(value)
@@ -409,26 +853,93 @@ class FloatType(NumberType):
 
 class DecimalType(BaseType):
     """A fixed-point decimal number field.
+
+    :param places:
+        Quantize converted values to this many decimal places. Default: None
+    :param rounding:
+        Rounding mode used for quantizing, one of the ``decimal.ROUND_*``
+        constants. Default: ``decimal.ROUND_HALF_EVEN``
+    :param serialize_as:
+        ``'string'`` serializes values as unicode strings. ``'minor_units'``
+        serializes values as integers scaled by ``places`` (e.g. cents).
+        Default: ``'string'``
+    :param read_minor_units:
+        Read all input other than ``Decimal`` instances, whether ints, floats
+        or strings, as minor units scaled by ``places``, the form written
+        with ``serialize_as='minor_units'``. Default: whether values are
+        serialized as minor units, so the field reads back its own output
+
     """
 
-    def __init__(self, min_value=None, max_value=None, **kwargs):
+    MESSAGES = {
+        'number_coerce': u"Value is not {}",
+        'number_min': u"{} value should be greater than {}",
+        'number_max': u"{} value should be less than {}",
+    }
+
+    SERIALIZE_AS = ('string', 'minor_units')
+
+    number_type = 'Decimal'
+
+    def __init__(self, min_value=None, max_value=None, places=None,
+                 rounding=decimal.ROUND_HALF_EVEN, serialize_as='string',
+                 read_minor_units=None, **kwargs):
         self.min_value, self.max_value = min_value, max_value
 
+        if serialize_as not in self.SERIALIZE_AS:
+            raise ValueError('serialize_as must be one of %s' %
+                             ', '.join(self.SERIALIZE_AS))
+        if serialize_as == 'minor_units' and places is None:
+            raise ValueError('Serializing as minor units requires places')
+        if read_minor_units is None:
+            read_minor_units = serialize_as == 'minor_units'
+        if read_minor_units and places is None:
+            raise ValueError('Reading minor units requires places')
+
+        self.places = places
+        self.rounding = rounding
+        self.serialize_as = serialize_as
+        self.read_minor_units = read_minor_units
+
+        # Built once per field so converting doesn't look up the thread's
+        # decimal context for every value
+        self._context = decimal.Context(rounding=rounding)
+        self._exponent = None
+        if places is not None:
+            self._exponent = decimal.Decimal(1).scaleb(-places)
+
         super(DecimalType, self).__init__(**kwargs)
 
+    def _jsonschema_type(self):
+        return 'integer' if self.serialize_as == 'minor_units' else 'string'
+
     def to_primitive(self, value):
+        if self.serialize_as == 'minor_units':
+            return int(value.scaleb(self.places, self._context))
         return unicode(value)
 
     def convert(self, value):
         if not isinstance(value, decimal.Decimal):
-            if not isinstance(value, basestring):
-                value = unicode(value)
             try:
-                value = decimal.Decimal(value)
+                if isinstance(value, (int, long)) and not isinstance(value, bool):
+                    value = decimal.Decimal(value)
+                else:
+                    if not isinstance(value, basestring):
+                        value = unicode(value)
+                    value = decimal.Decimal(value)
+                if self.read_minor_units:
+                    value = value.scaleb(-self.places, self._context)
 
             except (TypeError, decimal.InvalidOperation):
                 raise ConversionError(self.messages['number_coerce']
-                    .format(self.number_type))
+                    .format(self.number_type.lower()))
+
+        if self._exponent is not None:
+            try:
+                value = value.quantize(self._exponent, context=self._context)
+            except decimal.InvalidOperation:
+                raise ConversionError(self.messages['number_coerce']
+                    .format(self.number_type.lower()))
 
         return value
 
@@ -451,7 +962,17 @@ class HashType(BaseType):
         'hash_hex': u"Hash value is not hexadecimal.",
     }
 
+    def _jsonschema_type(self):
+        return 'integer'
+
     def convert(self, value):
+        if isinstance(value, (int, long)) and not isinstance(value, bool):
+            # hashes already converted to integers
+            if not 0 <= value < 16 ** self.LENGTH:
+                raise ConversionError(self.messages['hash_length'])
+            return value
+        if not isinstance(value, basestring):
+            raise ConversionError(self.messages['hash_hex'])
         if len(value) != self.LENGTH:
             raise ValidationError(self.messages['hash_length'])
         try:
@@ -460,6 +981,16 @@ class HashType(BaseType):
             raise ConversionError(self.messages['hash_hex'])
         return value
 
+    @classmethod
+    def invalid_indices(cls, values):
+        """Returns the indices of the values that are not hashes of the right
+        length made of hexadecimal digits. No integers are built.
+        """
+        length, hexdigits = cls.LENGTH, string.hexdigits
+        return [index for index, value in enumerate(values)
+                if not isinstance(value, basestring) or len(value) != length
+                or value.strip(hexdigits)]
+
 
 class MD5Type(HashType):
     """A field that validates input as resembling an MD5 hash.
@@ -487,6 +1018,9 @@ class BooleanType(BaseType):
     TRUE_VALUES = ('True', 'true', '1')
     FALSE_VALUES = ('False', 'false', '0')
 
+    def _jsonschema_type(self):
+        return 'boolean'
+
     def convert(self, value):
         if isinstance(value, basestring):
             if value in self.TRUE_VALUES:
@@ -513,16 +1047,31 @@ class DateType(BaseType):
         self.serialized_format = self.SERIALIZED_FORMAT
         super(DateType, self).__init__(**kwargs)
 
+    def _jsonschema_type(self):
+        return 'string'
+
+    def _jsonschema_format(self):
+        if self.serialized_format == self.SERIALIZED_FORMAT:
+            return 'date'
+        return None
+
     def convert(self, value):
         if isinstance(value, datetime.date):
             return value
 
         try:
+            if (self.serialized_format == self.SERIALIZED_FORMAT and
+                    isinstance(value, basestring)):
+                date = parse_iso_date(value)
+                if date is not None:
+                    return date
             return datetime.datetime.strptime(value, self.serialized_format).date()
         except (ValueError, TypeError):
             raise ConversionError(self.messages['parse'].format(value))
 
     def to_primitive(self, value):
+        if self.serialized_format == self.SERIALIZED_FORMAT:
+            return format_iso_date(value)
         return value.strftime(self.serialized_format)
 
 
@@ -531,7 +1080,9 @@ class DateTimeType(BaseType):
 
     :param formats:
         A value or list of values suitable for ``datetime.datetime.strptime``
-        parsing. Default: `('%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S')`
+        parsing. Default: `('%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S')`.
+        With the default formats, values are parsed by a dedicated ISO-8601
+        parser that also accepts ``Z`` and ``+HH:MM`` timezone designators.
     :param serialized_format:
         The output format suitable for Python ``strftime``. Default: ``'%Y-%m-%dT%H:%M:%S.%f'``
 
@@ -548,7 +1099,7 @@ class DateTimeType(BaseType):
         """
 
         """
-        if isinstance(format, basestring):
+        if isinstance(formats, basestring):
             formats = [formats]
         if formats is None:
             formats = self.DEFAULT_FORMATS
@@ -556,12 +1107,29 @@ class DateTimeType(BaseType):
             serialized_format = self.SERIALIZED_FORMAT
         self.formats = formats
         self.serialized_format = serialized_format
+        self.parse_iso = tuple(formats) == self.DEFAULT_FORMATS
         super(DateTimeType, self).__init__(**kwargs)
 
+    def _jsonschema_type(self):
+        return 'string'
+
+    def _jsonschema_format(self):
+        if self.serialized_format == self.SERIALIZED_FORMAT:
+            return 'date-time'
+        return None
+
     def convert(self, value):
         if isinstance(value, datetime.datetime):
             return value
 
+        if self.parse_iso and isinstance(value, basestring):
+            try:
+                dt = parse_iso_datetime(value)
+            except ValueError:
+                dt = None
+            if dt is not None:
+                return dt
+
         for format in self.formats:
             try:
                 return datetime.datetime.strptime(value, format)
@@ -572,6 +1140,8 @@ class DateTimeType(BaseType):
     def to_primitive(self, value):
         if callable(self.serialized_format):
             return self.serialized_format(value)
+        if self.serialized_format == self.SERIALIZED_FORMAT:
+            return format_iso_datetime(value)
         return value.strftime(self.serialized_format)
 
 
@@ -579,6 +1149,9 @@ class GeoPointType(BaseType):
     """A list storing a latitude and longitude.
     """
 
+    def _jsonschema_type(self):
+        return 'array'
+
     def convert(self, value):
         """Make sure that a geo-value is of type (x, y)
         """
@@ -2,32 +2,117 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import division
-from ..exceptions import ValidationError, ConversionError, ModelValidationError, StopValidation
+import contextlib
+import threading
+
+from ..exceptions import (
+    BaseError, ValidationError, ConversionError, ModelValidationError, StopValidation,
+)
+from ..deferred import Future, gather
 from .base import BaseType
 
 
+_local = threading.local()
+
+
+@contextlib.contextmanager
+def checking_nested_models():
+    """Makes ``ModelType`` fields validated in the current thread only check
+    their instances instead of storing the validated data on them, for
+    validation that must not change the models it reads.
+    """
+    previous = getattr(_local, 'checking', False)
+    _local.checking = True
+    try:
+        yield
+    finally:
+        _local.checking = previous
+
+
+def _settle(errors, pending, finish=None):
+    """Returns a future that is done once all ``(key, future)`` pairs in
+    ``pending`` are. The messages of futures that fail are added to
+    ``errors`` under their key, or merged into it for the key ``None``. Then
+    ``finish`` is called with the errors, and the future fails with a
+    ``ValidationError`` holding the errors left, if any.
+    """
+    result = Future()
+
+    def done():
+        try:
+            for key, future in pending:
+                try:
+                    future.result()
+                except BaseError as e:
+                    if key is None:
+                        errors.update(e.messages)
+                    elif isinstance(errors.get(key), list):
+                        errors[key] = errors[key] + e.messages
+                    else:
+                        errors[key] = e.messages
+            if finish is not None:
+                finish(errors)
+        except Exception as e:
+            result.set_exception(e)
+            return
+        if errors:
+            result.set_exception(ValidationError(errors))
+        else:
+            result.set_result(None)
+
+    gather([future for _, future in pending], done)
+    return result
+
+
 class MultiType(BaseType):
 
-    def validate(self, value, old_value=None):
+    # Validators of the items or the nested model, which are passed the
+    # sample and a list collecting futures
+    ITEM_VALIDATORS = ('validate_items', 'validate_model')
+
+    def validate(self, value, old_value=None, sample=None):
         """Report dictionary of errors with lists of errors as values of each
         key. Used by ModelType and ListType.
 
+        :param sample:
+            A ``Sample`` passed on to ``validate_items`` of collection types.
         """
-        errors = {}
+        errors = self._run(value, old_value, sample, None)
+        if errors:
+            raise ValidationError(errors)
+
+        return value
 
+    def run_validators(self, value, old_value=None, sample=None):
+        """Like :meth:`validate`, but doesn't wait for validators of items
+        or nested models that return futures. Returns an empty list, or a
+        list with a single future that fails with a ``ValidationError``
+        holding the errors in the same shape as ``validate`` raises.
+        """
+        pending = []
+        errors = self._run(value, old_value, sample, pending)
+        if pending:
+            return [_settle(errors, pending)]
+        if errors:
+            raise ValidationError(errors)
+        return []
+
+    def _run(self, value, old_value, sample, pending):
+        errors = {}
         for validator in self.validators:
             try:
-                validator(value, old_value)
+                # validators collected by TypeMeta are partials of the methods
+                name = getattr(getattr(validator, 'func', None), '__name__', None)
+                if name in self.ITEM_VALIDATORS:
+                    validator(value, old_value, sample, pending)
+                else:
+                    validator(value, old_value)
             except ModelValidationError, e:
                 errors.update(e.messages)
 
                 if isinstance(e, StopValidation):
                     break
-
-        if errors:
-            raise ValidationError(errors)
-
-        return value
+        return errors
 
     def filter_by_role(self, clean_value, primitive_value, role, raise_error_on_role=False):
         raise NotImplemented()
@@ -36,15 +121,27 @@ class MultiType(BaseType):
 class ModelType(MultiType):
     def __init__(self, model_class, **kwargs):
         self.model_class = model_class
-        self.fields = self.model_class.fields
 
-        validators = kwargs.pop("validators", [])
+        super(ModelType, self).__init__(**kwargs)
 
-        def validate_model(model_instance, *args):
+    def validate_model(self, model_instance, old_value=None, sample=None, pending=None):
+        """Validates the nested model. With ``pending``, the future of
+        ``validate_async`` is added to it instead of waiting.
+        """
+        if getattr(_local, 'checking', False):
+            model_instance._check()
+        elif pending is None:
             model_instance.validate()
-            return model_instance
+        else:
+            pending.append((None, model_instance.validate_async()))
+        return model_instance
+
+    def _jsonschema_type(self):
+        return 'object'
 
-        super(ModelType, self).__init__(validators=[validate_model] + validators,  **kwargs)
+    @property
+    def fields(self):
+        return self.model_class.fields
 
     def __repr__(self):
         return object.__repr__(self)[:-1] + ' for %s>' % self.model_class
@@ -65,10 +162,20 @@ class ModelType(MultiType):
         # not obviously useful
         return self.model_class(value)
 
+    def trusted(self, value, check=False):
+        if value is None or isinstance(value, self.model_class):
+            return value
+        if check and not isinstance(value, dict):
+            raise ConversionError(u'Please use a mapping for this field or {} instance instead of {}.'.format(
+                self.model_class.__name__,
+                type(value).__name__))
+        return self.model_class.from_trusted(value, check)
+
     def to_primitive(self, model_instance, include_serializables=True):
         primitive_data = {}
+        names = model_instance._wire_names
         for field_name, field, value in model_instance.atoms(include_serializables):
-            serialized_name = field.serialized_name or field_name
+            serialized_name = names[field_name].name
 
             if value is None:
                 if field.serialize_when_none or (field.serialize_when_none is None and self.model_class._options.serialize_when_none):
@@ -89,8 +196,9 @@ class ModelType(MultiType):
             raise ValueError(u'%s Model has no role "%s"' % (
                 self.model_class.__name__, role))
 
+        names = model_instance._wire_names
         for field_name, field, value in model_instance.atoms(include_serializables):
-            serialized_name = field.serialized_name or field_name
+            serialized_name = names[field_name].name
             if not serialized_name in primitive_data:
                 continue
 
@@ -120,23 +228,35 @@ EMPTY_LIST = "[]"
 
 class ListType(MultiType):
 
-    def __init__(self, field, min_size=None, max_size=None, **kwargs):
+    def __init__(self, field, min_size=None, max_size=None, drop_invalid=False,
+                 sample=None, **kwargs):
         if not isinstance(field, BaseType):
             field = field(**kwargs)
 
         self.field = field
         self.min_size = min_size
         self.max_size = max_size
+        self.drop_invalid = drop_invalid
+        self.sample = sample
 
-        validators = [self.check_length, self.validate_items] + kwargs.pop("validators", [])
+        # validate_items is collected by TypeMeta and runs first, so with
+        # drop_invalid the length counts the items that are left
+        validators = [self.check_length] + kwargs.pop("validators", [])
 
         super(ListType, self).__init__(validators=validators, **kwargs)
 
+    def _jsonschema_type(self):
+        return 'array'
+
     @property
     def model_class(self):
         return self.field.model_class
 
     def _force_list(self, value):
+        # lists are returned as they are, callers must not change them
+        if isinstance(value, list):
+            return value
+
         if value is None or value == EMPTY_LIST:
             return []
 
@@ -145,16 +265,108 @@ class ListType(MultiType):
                 raise TypeError()
 
             if isinstance(value, dict):
-                return [value[str(k)] for k in sorted(map(int, value.keys()))]
+                return [value[k] for k in sorted(value, key=int)]
 
             return list(value)
         except TypeError:
             return [value]
 
-    def convert(self, value):
+    def convert(self, value, in_place=False):
+        """
+        :param in_place:
+            Replace the items of a ``list`` with their converted values
+            instead of building a new list. Only for lists nothing else
+            refers to.
+        """
         items = self._force_list(value)
+        convert = self.field.convert
+
+        if self.drop_invalid:
+            converted = items if in_place and items is value else []
+            kept = 0
+            for item in items:
+                try:
+                    item = convert(item)
+                except BaseError:
+                    # some types raise ValidationError from convert too
+                    continue
+                if converted is items:
+                    items[kept] = item
+                else:
+                    converted.append(item)
+                kept += 1
+            del converted[kept:]
+            return converted
+
+        if in_place and items is value:
+            for index, item in enumerate(items):
+                items[index] = convert(item)
+            return items
+
+        return map(convert, items)
+
+    def clean(self, value, in_place=False):
+        """Converts and validates the items of raw data and returns their
+        primitive values, all in one pass over the items. Unlike calling
+        ``convert``, ``validate`` and ``to_primitive`` in turn, no list of
+        converted items is built.
+
+        Items and the length of the list are validated. Validators passed
+        to the field are not run, since they would need the converted list.
+        Errors are keyed by the index of the item. With ``drop_invalid``
+        invalid items are left out instead.
+
+        :param in_place:
+            Write the primitive values into the given ``list``. Only for
+            lists nothing else refers to.
+        """
+        items = self._force_list(value)
+        drop_invalid = self.drop_invalid
+        if not drop_invalid:
+            self.check_length(items)
+        self.field.prefetch(items)
+
+        if in_place and items is value:
+            primitives = items
+        else:
+            primitives = [None] * len(items)
 
-        return map(self.field.convert, items)
+        field = self.field
+        errors = {}
+        kept = 0
+        for index, item in enumerate(items):
+            try:
+                item = field.convert(item)
+                field.validate(item)
+            except ConversionError:
+                if not drop_invalid:
+                    raise
+                continue
+            except BaseError, e:
+                if not drop_invalid:
+                    errors[index] = e.messages
+                continue
+            primitives[kept if drop_invalid else index] = field.to_primitive(item)
+            kept += 1
+
+        if drop_invalid:
+            del primitives[kept:]
+            self.check_length(primitives)
+        elif errors:
+            raise ValidationError(errors)
+
+        return primitives
+
+    def trusted(self, value, check=False):
+        if value is None:
+            return None
+        if check and not isinstance(value, list):
+            raise ConversionError(u'Trusted value of type {} is not a list.'.format(
+                type(value).__name__))
+        # lists of simple values are used as they are
+        if check or isinstance(self.field, MultiType):
+            value = [self.field.trusted(item, check) for item in value]
+        return value
 
     def check_length(self, value, *args):
         list_length = len(value) if value else 0
@@ -173,20 +385,68 @@ class ListType(MultiType):
             ) % self.max_size
             raise ValidationError(message)
 
-    def validate_items(self, items, *args):
-        errors = []
-        for idx, item in enumerate(items, 1):
+    def validate_items(self, items, old_value=None, sample=None, pending=None):
+        """Validates every item, raising a ``ValidationError`` with the errors
+        keyed by the index of the item. With ``drop_invalid`` invalid items
+        are removed from ``items`` instead.
+
+        :param sample:
+            A ``Sample`` picking the items to check instead of all of them.
+            Defaults to the ``sample`` of the field.
+        :param pending:
+            A list collecting a future for item validators that return
+            futures, instead of waiting for them. Invalid items are then
+            dropped once the future is done.
+        """
+        sample = sample or self.sample
+        if sample is None:
+            checked = xrange(len(items))
+            self.field.prefetch(items)
+        else:
+            checked = sample.pick(items)
+            sample.checked[self] = checked
+            self.field.prefetch([items[index] for index in checked])
+
+        errors = {}
+        item_pending = []
+        field = self.field
+        for index in checked:
             try:
-                self.field.validate(item)
+                if pending is None:
+                    field.validate(items[index])
+                else:
+                    for future in field.run_validators(items[index]):
+                        item_pending.append((index, future))
             except ValidationError, e:
-                errors.append(e.message)
+                errors[index] = e.messages
 
+        if item_pending:
+            pending.append((None, _settle(
+                errors, item_pending, lambda errors: self._drop_invalid(items, errors))))
+            return
+
+        self._drop_invalid(items, errors)
         if errors:
             raise ValidationError(errors)
 
+    def _drop_invalid(self, items, errors):
+        # removes the items with errors and their errors with drop_invalid
+        if self.drop_invalid and errors:
+            items[:] = [item for index, item in enumerate(items)
+                        if index not in errors]
+            errors.clear()
+
     def to_primitive(self, value):
         return map(self.field.to_primitive, value)
 
+    def iter_primitive(self, value):
+        """Yields the primitive values of the items one at a time, to stream
+        a long list without building its primitive copy.
+        """
+        to_primitive = self.field.to_primitive
+        for item in value:
+            yield to_primitive(item)
+
     def filter_by_role(self, clean_list, primitive_list, role, raise_error_on_role=False):
         if isinstance(self.field, MultiType):
             for clean_value, primitive_value in zip(clean_list, primitive_list):
@@ -200,25 +460,46 @@ class ListType(MultiType):
 
 EMPTY_DICT = "{}"
 
+KEY_CACHE_SIZE = 65536
+
+_CACHED_WIRE_KEY_TYPES = (str, int, long)
+
 
 class DictType(MultiType):
 
-    def __init__(self, field, coerce_key=None, **kwargs):
+    def __init__(self, field, coerce_key=None, sample=None, **kwargs):
         if not isinstance(field, BaseType):
             field = field(**kwargs)
 
         self.coerce_key = coerce_key or str
         self.field = field
+        self.sample = sample
+
+        # keys that already have the type coerce_key returns are kept as is
+        self._key_type = self.coerce_key if isinstance(self.coerce_key, type) else None
+        # the same keys keep coming back, so their coerced and serialized
+        # forms are remembered per field
+        self._coerced_keys = {}
+        self._wire_keys = {}
 
-        validators = [self.validate_items] + kwargs.pop("validators", [])
+        validators = kwargs.pop("validators", [])
 
         super(DictType, self).__init__(validators=validators, **kwargs)
 
+    def _jsonschema_type(self):
+        return 'object'
+
     @property
     def model_class(self):
         return self.field.model_class
 
-    def convert(self, value, safe=False):
+    def convert(self, value, safe=False, in_place=False):
+        """
+        :param in_place:
+            Replace the keys and values of the given ``dict`` with their
+            converted forms instead of building a new dict. Only for dicts
+            nothing else refers to.
+        """
         if value == EMPTY_DICT:
             value = {}
 
@@ -227,22 +508,110 @@ class DictType(MultiType):
         if not isinstance(value, dict):
             raise ValidationError(u'Only dictionaries may be used in a DictType')
 
-        return dict((self.coerce_key(k), self.field.convert(v))
-                    for k, v in value.iteritems())
+        coerce = self.coerce
+        convert = self.field.convert
+
+        if in_place:
+            for key in value.keys():
+                new_key = coerce(key)
+                if new_key is key or (new_key == key and type(new_key) is type(key)):
+                    value[key] = convert(value[key])
+                else:
+                    value[new_key] = convert(value.pop(key))
+            return value
+
+        return dict((coerce(k), convert(v)) for k, v in value.iteritems())
+
+    def coerce(self, key):
+        """Returns ``coerce_key(key)``, skipping the call for keys of the
+        target type and remembering the result for string keys.
+        """
+        if type(key) is self._key_type:
+            return key
+        if not isinstance(key, basestring):
+            return self.coerce_key(key)
+        try:
+            return self._coerced_keys[key]
+        except KeyError:
+            if len(self._coerced_keys) >= KEY_CACHE_SIZE:
+                self._coerced_keys.clear()
+            coerced = self._coerced_keys[key] = self.coerce_key(key)
+            return coerced
+
+    def wire_key(self, key):
+        """Returns the key as it appears in serialized data."""
+        key_type = type(key)
+        if key_type is unicode:
+            return key
+        if key_type not in _CACHED_WIRE_KEY_TYPES:
+            return unicode(key)  # equal keys of other types may differ as text
+        try:
+            return self._wire_keys[key]
+        except KeyError:
+            if len(self._wire_keys) >= KEY_CACHE_SIZE:
+                self._wire_keys.clear()
+            wire_key = self._wire_keys[key] = unicode(key)
+            return wire_key
+
+    def trusted(self, value, check=False):
+        if value is None:
+            return None
+        if check and not isinstance(value, dict):
+            raise ConversionError(u'Only dictionaries may be used in a DictType')
+        if check or isinstance(self.field, MultiType):
+            value = dict((k, self.field.trusted(v, check))
+                         for k, v in value.iteritems())
+        return value
+
+    def validate_items(self, items, old_value=None, sample=None, pending=None):
+        """
+        :param sample:
+            A ``Sample`` picking the items to check instead of all of them.
+            Defaults to the ``sample`` of the field.
+        :param pending:
+            A list collecting a future for item validators that return
+            futures, instead of waiting for them.
+        """
+        sample = sample or self.sample
+        if sample is None:
+            pairs = items.iteritems()
+            self.field.prefetch(items.values())
+        else:
+            keys = sample.pick(items)
+            sample.checked[self] = keys
+            pairs = [(key, items[key]) for key in keys]
+            self.field.prefetch([value for _, value in pairs])
 
-    def validate_items(self, items, *args):
         errors = {}
-        for key, value in items.iteritems():
+        item_pending = []
+        for key, value in pairs:
             try:
-                self.field.validate(value)
+                if pending is None:
+                    self.field.validate(value)
+                else:
+                    for future in self.field.run_validators(value):
+                        item_pending.append((key, future))
             except ValidationError, e:
-                errors[key] = e
+                errors[key] = e.messages
 
-        if errors:
+        if item_pending:
+            pending.append((None, _settle(errors, item_pending)))
+        elif errors:
             raise ValidationError(errors)
 
     def to_primitive(self, value):
-        return dict((unicode(k), self.field.to_primitive(v)) for k, v in value.iteritems())
+        wire_key = self.wire_key
+        to_primitive = self.field.to_primitive
+        return dict((wire_key(k), to_primitive(v)) for k, v in value.iteritems())
+
+    def iter_primitive(self, value):
+        """Yields ``(key, primitive value)`` pairs one at a time, to stream a
+        large dict without building its primitive copy.
+        """
+        wire_key = self.wire_key
+        to_primitive = self.field.to_primitive
+        for key, item in value.iteritems():
+            yield wire_key(key), to_primitive(item)
 
     def filter_by_role(self, clean_data, primitive_data, role, raise_error_on_role=False):
         if clean_data is None:
@@ -255,12 +624,13 @@ class DictType(MultiType):
                 (self.field.serialize_when_none is None and self.model_class._options.serialize_when_none))
 
             for key, clean_value in clean_data.iteritems():
-                primitive_value = primitive_data[unicode(key)]
+                wire_key = self.wire_key(key)
+                primitive_value = primitive_data[wire_key]
 
                 self.field.filter_by_role(clean_value, primitive_value, role)
 
                 if not primitive_value and not serialize_when_none:
-                        primitive_data.pop(unicode(key))
+                        primitive_data.pop(wire_key)
 
         if not primitive_data and not serialize_when_none:
             return None
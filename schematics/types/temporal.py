@@ -3,26 +3,46 @@ from __future__ import absolute_import
 import datetime
 from time import mktime
 
-try:
-    from dateutil.tz import tzutc, tzlocal
-except ImportError:
-    raise ImportError(
-        'Using the datetime fields requires the dateutil library. '
-        'You can obtain dateutil from http://labix.org/python-dateutil'
-    )
+from .base import DateTimeType, ConversionError, UTC
 
-from .base import DateTimeType, ConversionError
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=UTC)
+
+# Number of units per second and the matching ``timedelta`` keyword
+PRECISIONS = {
+    's': (1, 'seconds'),
+    'ms': (1000, 'milliseconds'),
+    'us': (1000000, 'microseconds'),
+}
 
 
 class TimeStampType(DateTimeType):
     """Variant of a datetime field that saves itself as a unix timestamp (int)
     instead of a ISO-8601 string.
+
+    :param precision:
+        Unit of the timestamp: ``'s'``, ``'ms'`` or ``'us'``. Default: ``'s'``
     """
 
     MESSAGES = {
         'negative': u'Timestamp cannot be negative.',
+        'range': u'Timestamp is out of range.',
     }
 
+    def __init__(self, formats=None, serialized_format=None, precision='s',
+                 **kwargs):
+        if precision not in PRECISIONS:
+            raise ValueError('precision must be one of %s' %
+                             ', '.join(sorted(PRECISIONS)))
+        self.precision = precision
+        super(TimeStampType, self).__init__(formats, serialized_format, **kwargs)
+
+    def _jsonschema_type(self):
+        return 'integer'
+
+    def _jsonschema_format(self):
+        return None
+
     def convert(self, value):
         """Will try to parse the value as a timestamp.  If that fails it
         will fallback to DateTimeType's value parsing.
@@ -36,24 +56,36 @@ class TimeStampType(DateTimeType):
             value = float(value)
             if value < 0:
                 raise ConversionError(self.messages['negative'])
-            return TimeStampType.timestamp_to_date(value)
+            return TimeStampType.timestamp_to_date(value, self.precision)
         except ConversionError as e:
             raise e
+        except OverflowError:
+            raise ConversionError(self.messages['range'])
         except (TypeError, ValueError):
             pass
 
         return super(TimeStampType, self).convert(value)
 
     @classmethod
-    def timestamp_to_date(cls, value):
-        return datetime.datetime.fromtimestamp(value, tz=tzutc())
+    def timestamp_to_date(cls, value, precision='s'):
+        """Converts a timestamp in ``precision`` units to an aware UTC
+        datetime.
+        """
+        unit = PRECISIONS[precision][1]
+        return EPOCH + datetime.timedelta(**{unit: value})
 
     @classmethod
-    def date_to_timestamp(cls, value):
+    def date_to_timestamp(cls, value, precision='s'):
+        """Converts a datetime to an integer timestamp in ``precision`` units,
+        truncating smaller units. Naive datetimes are taken to be local time.
+        """
         if value.tzinfo is None:
-            value = value.replace(tzinfo=tzlocal())
-        return int(round(mktime(value.astimezone(tzutc()).timetuple())))
+            seconds = int(mktime(value.timetuple()))
+        else:
+            delta = value - EPOCH
+            seconds = delta.days * 86400 + delta.seconds
+        factor = PRECISIONS[precision][0]
+        return seconds * factor + value.microsecond * factor // 1000000
 
     def to_primitive(self, value):
-        v = TimeStampType.date_to_timestamp(value)
-        return v
+        return TimeStampType.date_to_timestamp(value, self.precision)
@@ -0,0 +1,220 @@
+from __future__ import absolute_import
+
+import httplib
+import socket
+import threading
+import time
+import urlparse
+from Queue import Queue
+
+
+# Statuses of servers that don't answer HEAD requests, whose URLs are
+# checked with GET instead
+HEAD_NOT_ALLOWED = (405, 501)
+
+
+class ConnectionPool(object):
+    """Keeps idle HTTP connections per host, so checking many URLs on the same
+    host reuses them no matter which thread checks them.
+
+    :param max_idle_per_host:
+        Maximum number of idle connections kept for each host. Default: 4
+    :param max_idle:
+        Maximum number of idle connections kept for all hosts. Default: 64
+    """
+
+    def __init__(self, max_idle_per_host=4, max_idle=64):
+        self.max_idle_per_host = max_idle_per_host
+        self.max_idle = max_idle
+        self._idle = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def connect(self, key, timeout):
+        """Opens a new connection for ``key``, a ``(scheme, netloc)`` tuple."""
+        if key[0] == 'https':
+            return httplib.HTTPSConnection(key[1], timeout=timeout)
+        return httplib.HTTPConnection(key[1], timeout=timeout)
+
+    def get(self, key, timeout):
+        """Returns an idle connection for ``key`` or a new one."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self._count -= 1
+                return idle.pop()
+        return self.connect(key, timeout)
+
+    def put(self, key, connection):
+        """Keeps ``connection`` for reuse, or closes it if the pool is full."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host and self._count < self.max_idle:
+                idle.append(connection)
+                self._count += 1
+                return
+        connection.close()
+
+    def clear(self):
+        """Closes all idle connections."""
+        with self._lock:
+            idle, self._idle, self._count = self._idle, {}, 0
+        for connections in idle.itervalues():
+            for connection in connections:
+                connection.close()
+
+
+default_pool = ConnectionPool()
+
+
+def head_request(url, timeout, pool=None):
+    """Sends a ``HEAD`` request for ``url`` and tells whether it answered with
+    a non-error status. Servers that don't allow ``HEAD`` get a ``GET``
+    request instead. Connections are taken from and returned to ``pool``.
+
+    :param pool:
+        A :class:`ConnectionPool`. Default: a pool shared by all checks
+    """
+    if pool is None:
+        pool = default_pool
+    parts = urlparse.urlsplit(url)
+    key = (parts.scheme.lower(), parts.netloc)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+
+    # A kept-alive connection may have been closed by the server, so give a
+    # fresh connection one more try
+    for attempt in range(2):
+        if attempt == 0:
+            connection = pool.get(key, timeout)
+        else:
+            connection = pool.connect(key, timeout)
+        try:
+            connection.request('HEAD', path)
+            response = connection.getresponse()
+            response.read()
+        except (httplib.HTTPException, socket.error):
+            connection.close()
+            continue
+
+        if response.will_close:
+            connection.close()
+        else:
+            pool.put(key, connection)
+        if response.status in HEAD_NOT_ALLOWED:
+            return _get_request(pool.connect(key, timeout), path)
+        return response.status < 400
+    return False
+
+
+def _get_request(connection, path):
+    # The body isn't needed, so the connection is closed instead of reading
+    # it and kept out of the pool
+    try:
+        connection.request('GET', path)
+        return connection.getresponse().status < 400
+    except (httplib.HTTPException, socket.error):
+        return False
+    finally:
+        connection.close()
+
+
+class URLChecker(object):
+    """Checks whether URLs exist, used by ``URLType(verify_exists=True)``.
+
+    Results are cached for ``cache_ttl`` seconds and :meth:`exists_many`
+    checks a batch of URLs concurrently.
+
+    :param resolver:
+        A callable receiving a URL and the timeout, returning whether the URL
+        exists. Default: :func:`head_request`
+    :param timeout:
+        Seconds to wait for each request. Default: 5
+    :param max_workers:
+        Maximum number of concurrent requests. Default: 8
+    :param cache_ttl:
+        Seconds to remember a result. Default: 300
+    :param cache_size:
+        Maximum number of remembered results. Default: 4096
+    """
+
+    def __init__(self, resolver=head_request, timeout=5, max_workers=8,
+                 cache_ttl=300, cache_size=4096):
+        self.resolver = resolver
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def cached(self, url):
+        """Returns the cached result for ``url`` or ``None``."""
+        entry = self._cache.get(url)
+        if entry is not None and entry[0] > time.time():
+            return entry[1]
+        return None
+
+    def exists(self, url):
+        result = self.cached(url)
+        if result is None:
+            result = self._resolve(url)
+        return result
+
+    def exists_many(self, urls):
+        """Returns a list telling for each URL whether it exists. URLs that
+        aren't cached are checked concurrently.
+        """
+        results = dict((url, self.cached(url)) for url in urls)
+        pending = [url for url, result in results.iteritems() if result is None]
+
+        if len(pending) == 1:
+            results[pending[0]] = self._resolve(pending[0])
+        elif pending:
+            queue = Queue()
+            for url in pending:
+                queue.put(url)
+
+            def work():
+                while True:
+                    url = queue.get()
+                    if url is None:
+                        return
+                    results[url] = self._resolve(url)
+
+            workers = [threading.Thread(target=work)
+                       for _ in range(min(self.max_workers, len(pending)))]
+            for worker in workers:
+                queue.put(None)
+                worker.daemon = True
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        return [results[url] for url in urls]
+
+    def _resolve(self, url):
+        try:
+            result = bool(self.resolver(url, self.timeout))
+        except Exception:
+            result = False
+
+        with self._lock:
+            if len(self._cache) >= self.cache_size:
+                now = time.time()
+                for key, entry in self._cache.items():
+                    if entry[0] <= now:
+                        del self._cache[key]
+                if len(self._cache) >= self.cache_size:
+                    self._cache.clear()
+            self._cache[url] = (time.time() + self.cache_ttl, result)
+
+        return result
+
+
+default_checker = URLChecker()
@@ -1,8 +1,11 @@
 
 from .exceptions import BaseError, ValidationError
+from .deferred import Future, is_pending, gather
+from .types.compound import MultiType
 
 
-def validate(model, raw_data, partial=False, strict=False, context=None):
+def validate(model, raw_data, partial=False, strict=False, context=None, sample=None,
+             converted=False):
     """
     Validate some untrusted data using a model. Trusted data can be passed in
     the `context` parameter.
@@ -20,11 +23,68 @@ def validate(model, raw_data, partial=False, strict=False, context=None):
         Complain about unrecognized keys. Default: False
     :param context:
         A ``dict``-like structure that may contain already validated data.
+    :param sample:
+        A ``Sample`` picking the items of ``ListType`` and ``DictType``
+        fields to check instead of all of them.
+    :param converted:
+        The values of ``raw_data`` under field names were converted by the
+        model already. Scalar values are only validated, collections are
+        converted again. Default: False
 
     :returns: tuple(data, errors)
         data dict contains the valid raw_data plus the context data.
         errors dict contains all ValidationErrors found.
     """
+    data, errors = _validate(model, raw_data, partial, strict, context,
+                             sample=sample, converted=converted)
+
+    if len(errors) > 0:
+        raise ValidationError(errors)
+
+    return data
+
+
+def validate_async(model, raw_data, partial=False, strict=False, context=None,
+                   sample=None, converted=False):
+    """
+    Like :func:`validate`, but doesn't wait for validators that return a
+    future. Those of all fields run concurrently and a future is returned
+    that resolves to the validated data or fails with a ``ValidationError``
+    holding the errors in the same shape.
+    """
+    pending = []
+    data, errors = _validate(model, raw_data, partial, strict, context, pending,
+                             sample, converted)
+
+    result = Future()
+
+    def finish():
+        try:
+            _collect_pending(data, errors, pending)
+        except Exception as e:
+            # a validator failed for another reason than invalid data
+            result.set_exception(e)
+            return
+        if len(errors) > 0:
+            result.set_exception(ValidationError(errors))
+        else:
+            result.set_result(data)
+
+    gather([future for _, _, future in pending], finish)
+    return result
+
+
+def _validate(model, raw_data, partial, strict, context, pending=None,
+              sample=None, converted=False):
+    """
+    Runs the validation shared by :func:`validate` and :func:`validate_async`.
+
+    :param pending:
+        ``None`` to wait for validators returning futures, or a list that
+        collects ``(field_name, serialized_field_name, future)`` tuples.
+
+    :returns: tuple(data, errors)
+    """
     data = dict(context) if context is not None else {}
     errors = {}
 
@@ -34,9 +94,15 @@ def validate(model, raw_data, partial=False, strict=False, context=None):
         errors.update(serializable_errors)
 
     # validate raw_data by the model fields
-    for field_name, field in model._fields.iteritems():
-        serialized_field_name = field.serialized_name or field_name
-        if serialized_field_name in raw_data:
+    for field_name, serialized_field_name, field in model._plan:
+        needs_conversion = True
+        if converted and field_name in raw_data:
+            value = raw_data[field_name]
+            # lists, dicts and models may have been changed in place since
+            # they were converted, so only scalar values are trusted
+            needs_conversion = isinstance(field, MultiType) or \
+                isinstance(value, (list, dict))
+        elif serialized_field_name in raw_data:
             value = raw_data[serialized_field_name]
         elif field_name in raw_data:
             value = raw_data[field_name]
@@ -50,8 +116,16 @@ def validate(model, raw_data, partial=False, strict=False, context=None):
                 errors[serialized_field_name] = [field.messages['required'], ]
         else:
             try:
-                value = field.convert(value)
-                field.validate(value, data.get(field_name))
+                if needs_conversion:
+                    value = field.convert(value)
+                args = (value, data.get(field_name))
+                if sample is not None and isinstance(field, MultiType):
+                    args += (sample,)
+                if pending is None:
+                    field.validate(*args)
+                else:
+                    for future in field.run_validators(*args):
+                        pending.append((field_name, serialized_field_name, future))
                 data[field_name] = value
             except BaseError as e:
                 errors[serialized_field_name] = e.messages
@@ -64,21 +138,38 @@ def validate(model, raw_data, partial=False, strict=False, context=None):
 
     # validate an instance with its own validators
     if hasattr(model, '_data'):
-        instance_errors = _validate_instance(model, data)
+        instance_errors = _validate_instance(model, data, pending)
         errors.update(instance_errors)
 
-    if len(errors) > 0:
-        raise ValidationError(errors)
-
-    return data
+    return data, errors
 
 
-def _validate_instance(instance, data):
+def _collect_pending(data, errors, pending):
+    """
+    Adds the errors of finished futures to ``errors`` and removes the fields
+    they belong to from ``data``.
+    """
+    for field_name, serialized_field_name, future in pending:
+        try:
+            future.result()
+        except BaseError as e:
+            if isinstance(e.messages, dict):
+                # errors of items or nested models
+                errors.setdefault(serialized_field_name, {}).update(e.messages)
+            else:
+                errors.setdefault(serialized_field_name, []).extend(e.messages)
+            data.pop(field_name, None)
+
+
+def _validate_instance(instance, data, pending=None):
     """
     Validate data using instance level methods.
 
     :param data:
         A dict with data to validate. Invalid items are removed from it.
+    :param pending:
+        ``None`` to wait for validators returning futures, or a list that
+        collects them.
 
     :returns:
         Errors of the fields that did not pass validation.
@@ -86,12 +177,17 @@ def _validate_instance(instance, data):
     errors = {}
     for field_name, value in data.items():
         if field_name in instance._validator_functions:
+            wire_name = instance._wire_names.get(field_name)
+            serialized_field_name = wire_name.name if wire_name else field_name
             try:
                 context = dict(instance._data, **data)
-                instance._validator_functions[field_name](instance, context, value)
+                result = instance._validator_functions[field_name](instance, context, value)
+                if is_pending(result):
+                    if pending is None:
+                        result.result()
+                    else:
+                        pending.append((field_name, serialized_field_name, result))
             except BaseError as e:
-                field = instance._fields[field_name]
-                serialized_field_name = field.serialized_name or field_name
                 errors[serialized_field_name] = e.messages
                 data.pop(field_name, None)  # get rid of the invalid field
     return errors
@@ -108,8 +204,9 @@ def _serializable_setters(instance, raw_data):
         Errors of the setter fields that failed validation.
     """
     errors = {}
+    names = instance._wire_names
     for field_name, serializable in instance._serializables.iteritems():
-        serialized_field_name = serializable.serialized_name or field_name
+        serialized_field_name = names[field_name].name
         if serializable.fset and serialized_field_name in raw_data:
             value = raw_data[serialized_field_name]
             try:
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+import array
+import unittest
+
+from schematics.models import Model
+from schematics.types import IntType, FloatType, StringType
+from schematics.batch import ModelBatch
+from schematics.serialize import whitelist
+from schematics.exceptions import ModelConversionError, ModelValidationError
+
+
+class Player(Model):
+    name = StringType(required=True)
+    level = IntType()
+    score = FloatType(serialized_name="points")
+
+    class Options:
+        roles = {
+            "public": whitelist("name", "level"),
+        }
+
+
+class TestModelBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.batch = ModelBatch(Player, [
+            {"name": "Arthur", "level": "2", "points": 1.5},
+            Player({"name": "Ford", "level": 5}),
+        ])
+
+    def test_columns_are_stored_per_field(self):
+        self.assertEqual(len(self.batch), 2)
+        self.assertEqual(self.batch.column("name"), ["Arthur", u"Ford"])
+        self.assertEqual(self.batch.column("score"), [1.5, None])
+
+    def test_convert_packs_numeric_columns(self):
+        self.batch.convert()
+
+        level = self.batch.column("level")
+        self.assertIsInstance(level, array.array)
+        self.assertEqual(list(level), [2, 5])
+        # None values keep the column a list
+        self.assertEqual(self.batch.column("score"), [1.5, None])
+
+    def test_append_after_convert(self):
+        self.batch.convert()
+        self.batch.append({"name": "Zaphod", "level": 3})
+
+        self.assertIsInstance(self.batch.column("level"), array.array)
+        self.assertEqual(list(self.batch.column("level")), [2, 5, 3])
+
+        self.batch.append({"name": "Marvin", "level": "9"})
+        self.assertFalse(self.batch.converted)
+        self.assertEqual(self.batch.column("level"), [2, 5, 3, "9"])
+
+    def test_conversion_errors_are_keyed_by_row(self):
+        self.batch.append({"name": "Marvin", "level": "depressed"})
+
+        with self.assertRaises(ModelConversionError) as context:
+            self.batch.convert()
+
+        self.assertEqual(list(context.exception.messages), [2])
+        self.assertIn("level", context.exception.messages[2])
+
+    def test_validation_errors_are_keyed_by_row(self):
+        self.batch.append({"level": 1})
+
+        with self.assertRaises(ModelValidationError) as context:
+            self.batch.validate()
+
+        self.assertEqual(context.exception.messages, {
+            2: {"name": [u"This field is required."]},
+        })
+        self.batch.validate(partial=True)
+
+    def test_rows_are_models(self):
+        self.batch.convert()
+        player = self.batch[-1]
+
+        self.assertIsInstance(player, Player)
+        self.assertEqual(player.name, u"Ford")
+        self.assertEqual(player.level, 5)
+        self.assertEqual([p.name for p in self.batch], [u"Arthur", u"Ford"])
+
+        with self.assertRaises(IndexError):
+            self.batch[2]
+
+    def test_serialize(self):
+        self.batch.convert()
+
+        self.assertEqual(self.batch.serialize(), [
+            {"name": u"Arthur", "level": 2, "points": 1.5},
+            {"name": u"Ford", "level": 5, "points": None},
+        ])
+
+    def test_to_columns(self):
+        self.batch.convert()
+
+        self.assertEqual(self.batch.to_columns(), {
+            "name": [u"Arthur", u"Ford"],
+            "level": [2, 5],
+            "points": [1.5, None],
+        })
+        self.assertEqual(self.batch.to_columns(role="public"), {
+            "name": [u"Arthur", u"Ford"],
+            "level": [2, 5],
+        })
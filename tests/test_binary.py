@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+import datetime
+import decimal
+import unittest
+import uuid
+
+from schematics.models import Model
+from schematics.types import (
+    StringType, IntType, LongType, FloatType, BooleanType, DateType,
+    DateTimeType, UUIDType, DecimalType, MD5Type, fixed_offset,
+)
+from schematics.types.compound import ModelType, ListType, DictType
+from schematics.binary import dumps, loads, fingerprint
+from schematics.exceptions import IncompatibleSchemaError
+
+
+class Location(Model):
+    country_code = StringType()
+    visited = DateType()
+
+
+class Player(Model):
+    id = UUIDType()
+    name = StringType()
+    level = IntType()
+    xp = LongType()
+    ratio = FloatType()
+    active = BooleanType()
+    balance = DecimalType()
+    joined = DateTimeType()
+    last_seen = DateTimeType()
+    avatar = MD5Type()
+    home = ModelType(Location)
+    scores = ListType(IntType())
+    trips = ListType(ModelType(Location))
+    stats = DictType(IntType)
+
+
+class TestBinary(unittest.TestCase):
+
+    def setUp(self):
+        self.player = Player({
+            'id': uuid.uuid4(),
+            'name': u'J\xf6kull',
+            'level': -3,
+            'xp': 2 ** 70,
+            'ratio': 0.25,
+            'active': True,
+            'balance': decimal.Decimal('-12.340'),
+            'joined': datetime.datetime(2013, 3, 7, 15, 31, 2, 1234),
+            'last_seen': datetime.datetime(1969, 12, 31, 23, 0, tzinfo=fixed_offset(-330)),
+            'avatar': 'd41d8cd98f00b204e9800998ecf8427e',
+            'home': {'country_code': 'IS', 'visited': '2013-03-01'},
+            'scores': [1, 300],
+            'trips': [{'country_code': 'US'}, {'visited': '2012-01-01'}],
+            'stats': {'math': 10, 'art': 0},
+        })
+
+    def test_round_trip(self):
+        player = loads(Player, dumps(self.player))
+
+        self.assertEqual(player, self.player)
+        self.assertEqual(player.serialize(), self.player.serialize())
+        self.assertEqual(player.last_seen.utcoffset(), datetime.timedelta(minutes=-330))
+
+    def test_none_values(self):
+        player = loads(Player, dumps(Player({'name': 'Arthur'})))
+
+        self.assertEqual(player.name, u'Arthur')
+        self.assertIsNone(player.level)
+        self.assertIsNone(player.home)
+
+    def test_special_decimals(self):
+        player = loads(Player, dumps(Player({'balance': decimal.Decimal('Infinity')})))
+        self.assertEqual(player.balance, decimal.Decimal('Infinity'))
+
+    def test_compact_uuids(self):
+        class Token(Model):
+            id = UUIDType(compact=True)
+
+        token = Token({'id': uuid.uuid4()})
+        self.assertEqual(loads(Token, dumps(token)).id, token.id)
+
+    def test_read_models_are_not_converted_again(self):
+        class CountingType(StringType):
+            conversions = 0
+
+            def convert(self, value):
+                CountingType.conversions += 1
+                return super(CountingType, self).convert(value)
+
+        class Note(Model):
+            text = CountingType()
+
+        data = dumps(Note({'text': u'hi'}))
+        CountingType.conversions = 0
+        note = loads(Note, data)
+        note.validate()
+
+        self.assertEqual(CountingType.conversions, 0)
+        self.assertEqual(note.text, u'hi')
+
+    def test_records_have_no_keys(self):
+        data = dumps(self.player)
+        self.assertNotIn('country_code', data)
+        self.assertLess(len(data), len(str(self.player.serialize())) / 2)
+
+    def test_fingerprint(self):
+        class Other(Model):
+            country_code = StringType()
+            visited = DateTimeType()
+
+        class Same(Model):
+            country_code = StringType()
+            visited = DateType()
+
+        self.assertNotEqual(fingerprint(Other), fingerprint(Location))
+        self.assertEqual(fingerprint(Same), fingerprint(Location))
+
+        with self.assertRaises(IncompatibleSchemaError):
+            loads(Other, dumps(Location({'country_code': 'IS'})))
+
+    def test_fingerprint_changes_with_appended_fields(self):
+        class Ship(Model):
+            name = StringType()
+
+        data = dumps(Ship({'name': 'Heart of Gold'}))
+        Ship.append_field('crew', IntType())
+
+        with self.assertRaises(IncompatibleSchemaError):
+            loads(Ship, data)
+
+    def test_fingerprint_changes_with_fields_of_nested_models(self):
+        class Crew(Model):
+            name = StringType()
+
+        class Ship(Model):
+            captain = ModelType(Crew)
+
+        data = dumps(Ship({'captain': {'name': 'Zaphod'}}))
+        Crew.append_field('rank', IntType())
+
+        with self.assertRaises(IncompatibleSchemaError):
+            loads(Ship, data)
+
+    def test_model_nesting_itself(self):
+        class Node(Model):
+            name = StringType()
+
+        Node.append_field('children', ListType(ModelType(Node)))
+        node = Node({'name': 'a', 'children': [{'name': 'b', 'children': []}]})
+
+        self.assertEqual(loads(Node, dumps(node)).serialize(), node.serialize())
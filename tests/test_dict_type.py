@@ -153,3 +153,38 @@ class TestDictType(unittest.TestCase):
         self.assertEqual(d, {
             "categories": {"1": {"slug": "math"}}
         })
+
+    def test_convert_in_place(self):
+        field = DictType(IntType, coerce_key=int)
+        items = {'1': '10', 2: '20'}
+
+        self.assertEqual(field.convert(items), {1: 10, 2: 20})
+        self.assertEqual(items, {'1': '10', 2: '20'})
+
+        self.assertIs(field.convert(items, in_place=True), items)
+        self.assertEqual(items, {1: 10, 2: 20})
+
+    def test_iter_primitive(self):
+        field = DictType(IntType, coerce_key=int)
+
+        self.assertEqual(sorted(field.iter_primitive({1: 10, 2: 20})),
+                         [(u'1', 10), (u'2', 20)])
+
+    def test_key_coercion(self):
+        field = DictType(IntType, coerce_key=int)
+
+        self.assertEqual(field.convert({u'1': '1', 2: '2'}), {1: 1, 2: 2})
+        self.assertEqual(field._coerced_keys, {u'1': 1})
+
+        key = u'k\xe9y'
+        field = DictType(IntType, coerce_key=unicode)
+        self.assertIs(field.coerce(key), key)
+        self.assertEqual(field._coerced_keys, {})
+
+    def test_wire_keys(self):
+        field = DictType(IntType, coerce_key=int)
+
+        self.assertEqual(field.to_primitive({1: 10, 2: 20}), {u'1': 10, u'2': 20})
+        self.assertEqual(field._wire_keys, {1: u'1', 2: u'2'})
+        self.assertEqual(field.wire_key(1.0), u'1.0')
+        self.assertEqual(field.wire_key(True), u'True')
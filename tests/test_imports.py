@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+
+import os
+import subprocess
+import sys
+import unittest
+
+
+IMPORT_TIME_BUDGET = 0.5  # seconds
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_in_subprocess(module):
+    """Imports ``module`` in a fresh interpreter and returns the time the
+    import took and the names of all modules loaded afterwards.
+    """
+    code = (
+        'import sys, time\n'
+        'start = time.time()\n'
+        'import %s\n'
+        'print(time.time() - start)\n'
+        'print(" ".join(sys.modules))\n'
+    ) % module
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT)
+    elapsed, modules = output.decode('ascii').splitlines()
+    return float(elapsed), set(modules.split())
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_import_schematics(self):
+        elapsed, _ = import_in_subprocess('schematics')
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+    def test_import_models(self):
+        elapsed, _ = import_in_subprocess('schematics.models')
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+    def test_temporal_types_dont_import_dateutil(self):
+        _, modules = import_in_subprocess('schematics.types.temporal')
+        self.assertNotIn('dateutil', modules)
@@ -3,7 +3,7 @@
 import unittest
 
 from schematics.models import Model
-from schematics.types import IntType, StringType
+from schematics.types import IntType, StringType, MD5Type
 from schematics.types.compound import ModelType, ListType
 from schematics.serialize import wholelist
 from schematics.exceptions import ValidationError
@@ -175,3 +175,88 @@ class TestListTypeWithModelType(unittest.TestCase):
         errors = context.exception.messages
 
         self.assertEqual(errors['users'], [u'Please provide at least 1 item.'])
+
+    def test_convert_in_place(self):
+        field = ListType(IntType)
+        items = ["1", "2"]
+
+        self.assertEqual(field.convert(items), [1, 2])
+        self.assertEqual(items, ["1", "2"])
+
+        self.assertIs(field.convert(items, in_place=True), items)
+        self.assertEqual(items, [1, 2])
+
+        self.assertEqual(field.convert({'10': "3", '2': "4"}, in_place=True), [4, 3])
+
+    def test_clean(self):
+        class User(Model):
+            name = StringType(max_length=5)
+
+        field = ListType(ModelType(User), max_size=3)
+        items = [{'name': 'Arthur'}, {'name': 'Ford'}]
+
+        with self.assertRaises(ValidationError) as context:
+            field.clean(items)
+        self.assertEqual(context.exception.messages,
+                         {0: {'name': [u'String value is too long.']}})
+
+        items[0] = {'name': 'Zaph'}
+        self.assertEqual(field.clean(items), [{'name': u'Zaph'}, {'name': u'Ford'}])
+        self.assertIsInstance(items[0], dict)
+
+        self.assertIs(field.clean(items, in_place=True), items)
+        self.assertEqual(items, [{'name': u'Zaph'}, {'name': u'Ford'}])
+
+        self.assertRaises(ValidationError, field.clean, [{}] * 4)
+        self.assertEqual(ListType(IntType).clean(["1", 2]), [1, 2])
+
+    def test_iter_primitive(self):
+        class User(Model):
+            name = StringType()
+
+        field = ListType(ModelType(User))
+        items = field.convert([{'name': u'Arthur'}, {'name': u'Ford'}])
+
+        primitives = field.iter_primitive(items)
+
+        self.assertEqual(next(primitives), {'name': u'Arthur'})
+        self.assertEqual(list(primitives), [{'name': u'Ford'}])
+
+    def test_errors_are_keyed_by_index(self):
+        class User(Model):
+            tags = ListType(StringType(max_length=2))
+
+        with self.assertRaises(ValidationError) as context:
+            User({'tags': ['a', 'bcd', 'e', 'fgh']}).validate()
+
+        self.assertEqual(context.exception.messages, {'tags': {
+            1: [u'String value is too long.'],
+            3: [u'String value is too long.'],
+        }})
+
+    def test_drop_invalid(self):
+        class User(Model):
+            tags = ListType(StringType(max_length=2), drop_invalid=True, min_size=2)
+
+        user = User({'tags': ['a', 'bcd', {}, 'e']})
+        self.assertEqual(user.tags, [u'a', u'bcd', u'e'])
+
+        user.validate()
+        self.assertEqual(user.tags, [u'a', u'e'])
+
+        with self.assertRaises(ValidationError):
+            User({'tags': ['a', 'bcd']}).validate()
+
+        field = User.tags
+        items = ['a', {}, 'bcd', 'e', 4]
+        self.assertIs(field.clean(items, in_place=True), items)
+        self.assertEqual(items, [u'a', u'e', u'4'])
+
+    def test_drop_invalid_validation_errors_from_convert(self):
+        class File(Model):
+            hashes = ListType(MD5Type(), drop_invalid=True)
+
+        md5 = 'd41d8cd98f00b204e9800998ecf8427e'
+        self.assertEqual(File({'hashes': ['abc', md5]}).hashes,
+                         [MD5Type()(md5)])
+        self.assertEqual(File.hashes.clean(['abc', md5]), [MD5Type()(md5)])
@@ -123,3 +123,57 @@ class TestModelType(unittest.TestCase):
 
         self.assertEqual(pack.question.question_id, "1")
         self.assertEqual(pack.question.type, "text")
+
+
+class CountingType(IntType):
+
+    conversions = 0
+
+    def convert(self, value):
+        CountingType.conversions += 1
+        return super(CountingType, self).convert(value)
+
+
+class TestNestedHydration(unittest.TestCase):
+
+    def setUp(self):
+        class Item(Model):
+            qty = CountingType(serialized_name='quantity')
+
+        class Order(Model):
+            items = ListType(ModelType(Item))
+
+        self.Order = Order
+        CountingType.conversions = 0
+
+    def test_items_are_converted_once(self):
+        order = self.Order({'items': [{'quantity': '1'}, {'quantity': '2'}]})
+        order.validate()
+
+        self.assertEqual(CountingType.conversions, 2)
+        self.assertEqual([item._data for item in order.items], [{'qty': 1}, {'qty': 2}])
+        self.assertEqual([item._raw_data for item in order.items], [{}, {}])
+
+    def test_assigned_values_are_converted(self):
+        order = self.Order({'items': [{'quantity': '1'}]})
+        order.items[0].qty = '5'
+        order.validate()
+
+        self.assertEqual(order.items[0].qty, 5)
+
+    def test_conversion_errors_are_still_raised(self):
+        order = self.Order({'items': [{'quantity': '1'}]})
+        order.items[0].qty = 'x'
+
+        with self.assertRaises(ValidationError):
+            order.validate()
+
+    def test_collections_changed_in_place_are_converted(self):
+        class Scores(Model):
+            nums = ListType(IntType())
+
+        scores = Scores({'nums': [1]})
+        scores.nums.append('abc')
+
+        with self.assertRaises(ValidationError):
+            scores.validate()
@@ -7,7 +7,7 @@ from schematics.serialize import whitelist, blacklist
 from schematics.models import ModelOptions
 
 from schematics.types.base import StringType, IntType
-from schematics.types.compound import ModelType
+from schematics.types.compound import ModelType, ListType
 from schematics.exceptions import ValidationError, ConversionError, ModelConversionError
 
 
@@ -370,3 +370,144 @@ class TestAppendFields(unittest.TestCase):
         self.assertEqual(u.name, None)
         self.assertEqual(u.gender, None)
         self.assertRaises(ValidationError, u.validate)
+
+
+class TestWireNames(unittest.TestCase):
+
+    def test_wire_names_are_bound_per_model(self):
+        shared_type = StringType()
+
+        class User(Model):
+            name = shared_type
+            email = StringType(serialized_name=u'e-mail')
+
+        class Company(Model):
+            title = shared_type
+
+        self.assertEqual(User._wire_names['name'].name, 'name')
+        self.assertEqual(User._wire_names['email'].name, u'e-mail')
+        self.assertEqual(Company._wire_names['title'].name, 'title')
+
+    def test_wire_name_variants(self):
+        class User(Model):
+            name = StringType(serialized_name=u'n\xe4me')
+
+        wire_name = User._wire_names['name']
+        self.assertEqual(wire_name.text, u'n\xe4me')
+        self.assertEqual(wire_name.bytes, 'n\xc3\xa4me')
+        self.assertEqual(wire_name.json, '"n\\u00e4me":')
+
+    def test_append_field_adds_wire_name(self):
+        class User(Model):
+            pass
+
+        User.append_field('name', StringType(serialized_name='userName'))
+
+        self.assertEqual(User._wire_names['name'].name, 'userName')
+        self.assertEqual(User({'userName': 'Marvin'}).serialize(), {'userName': u'Marvin'})
+
+
+class TestModelViews(unittest.TestCase):
+
+    def setUp(self):
+        class Location(Model):
+            country_code = StringType(max_length=2)
+
+        class Player(Model):
+            id = IntType()
+            name = StringType(serialized_name='displayName')
+            home = ModelType(Location)
+
+        self.Player = Player
+        self.data = {'id': '42', 'displayName': 'Arthur', 'home': {'country_code': 'GBR'}}
+
+    def test_values_are_converted_on_read(self):
+        player = self.Player.view(self.data)
+
+        self.assertEqual(player._raw_data._converted, {})
+        self.assertEqual(player.id, 42)
+        self.assertEqual(player.name, u'Arthur')
+        self.assertEqual(player.home.country_code, u'GBR')
+        self.assertEqual(player, self.Player(self.data))
+
+    def test_mapping_is_not_copied(self):
+        player = self.Player.view(self.data)
+        self.data['id'] = 43
+
+        self.assertIs(player._raw_data.mapping, self.data)
+        self.assertEqual(player.id, 43)
+
+    def test_serialize_does_not_validate(self):
+        player = self.Player.view(self.data)
+
+        self.assertEqual(player.serialize(), {
+            'id': 42, 'displayName': u'Arthur', 'home': {'country_code': u'GBR'}})
+        self.assertEqual(player.to_json(),
+                         '{"id":42,"displayName":"Arthur","home":{"country_code":"GBR"}}')
+
+    def test_views_are_read_only(self):
+        player = self.Player.view(self.data)
+
+        with self.assertRaises(TypeError):
+            player.name = 'Ford'
+        self.assertEqual(self.data['displayName'], 'Arthur')
+
+
+class TestTrustedData(unittest.TestCase):
+
+    def setUp(self):
+        class Location(Model):
+            country_code = StringType()
+
+        class Player(Model):
+            id = IntType()
+            name = StringType(serialized_name='displayName')
+            home = ModelType(Location)
+            trips = ListType(ModelType(Location))
+            scores = ListType(IntType())
+
+        self.Location = Location
+        self.Player = Player
+
+    def test_values_are_stored_as_validated_data(self):
+        scores = [1, 2]
+        player = self.Player.from_trusted({
+            'id': 42, 'name': u'Arthur', 'home': {'country_code': u'GB'},
+            'trips': [{'country_code': u'IS'}], 'scores': scores,
+            'unknown': True,
+        })
+
+        self.assertEqual(player._raw_data, {})
+        self.assertEqual(player.id, 42)
+        self.assertIsInstance(player.home, self.Location)
+        self.assertEqual(player.home._data, {'country_code': u'GB'})
+        self.assertEqual(player.trips[0].country_code, u'IS')
+        self.assertIs(player.scores, scores)
+        self.assertEqual(player.serialize(), {
+            'id': 42, 'displayName': u'Arthur', 'home': {'country_code': u'GB'},
+            'trips': [{'country_code': u'IS'}], 'scores': [1, 2],
+        })
+
+    def test_values_are_not_converted(self):
+        player = self.Player.construct(id='42')
+
+        self.assertEqual(player.id, '42')
+        self.assertEqual(player, self.Player.from_trusted({'id': '42'}))
+
+    def test_check(self):
+        self.Player.from_trusted({'id': 42, 'trips': [self.Location()]}, check=True)
+
+        with self.assertRaises(ModelConversionError) as context:
+            self.Player.from_trusted({
+                'id': '42', 'name': 'Arthur', 'home': {'country_code': 1},
+                'scores': (1,), 'unknown': True,
+            }, check=True)
+        self.assertEqual(sorted(context.exception.messages),
+                         ['displayName', 'home', 'id', 'scores', 'unknown'])
+
+    def test_check_option(self):
+        class Player(self.Player):
+            class Options:
+                check_trusted = True
+
+        self.assertRaises(ModelConversionError, Player.construct, id='42')
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+import copy
+import cPickle as pickle
+import datetime
+import unittest
+
+from schematics.models import Model
+from schematics.types import StringType, IntType, DateTimeType
+from schematics.types.compound import ModelType, ListType
+from schematics.datastructures import OrderedDict
+from schematics.exceptions import IncompatibleSchemaError
+
+
+class Location(Model):
+    country_code = StringType()
+
+
+class Player(Model):
+    id = IntType()
+    display_name = StringType(serialized_name='displayName')
+    joined = DateTimeType()
+    home = ModelType(Location)
+    trips = ListType(ModelType(Location))
+
+
+class Ship(Model):
+    name = StringType()
+
+
+class Node(Model):
+    name = StringType()
+
+Node.append_field('children', ListType(ModelType(Node)))
+
+
+class TestPickle(unittest.TestCase):
+
+    def setUp(self):
+        self.player = Player({
+            'id': 1,
+            'displayName': u'Arthur',
+            'joined': datetime.datetime(2013, 3, 7, 15, 31),
+            'home': {'country_code': 'GB'},
+            'trips': [{'country_code': 'IS'}, {'country_code': 'US'}],
+            'unknown': 'kept',
+        })
+
+    def test_round_trip(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            player = pickle.loads(pickle.dumps(self.player, protocol))
+
+            self.assertEqual(player, self.player)
+            self.assertEqual(player.serialize(), self.player.serialize())
+            self.assertEqual(player._raw_data['unknown'], 'kept')
+
+    def test_converted_data_stays_converted(self):
+        player = pickle.loads(pickle.dumps(self.player, 2))
+        self.assertTrue(player._raw_converted)
+
+        self.player.id = '2'
+        player = pickle.loads(pickle.dumps(self.player, 2))
+        self.assertFalse(player._raw_converted)
+        player.validate()
+        self.assertEqual(player.id, 2)
+
+    def test_validated_data_stays_validated(self):
+        self.player.validate()
+        player = pickle.loads(pickle.dumps(self.player, 2))
+
+        self.assertEqual(player._data, self.player._data)
+        self.assertEqual(player._raw_data, {})
+
+    def test_field_names_are_not_pickled(self):
+        data = pickle.dumps(self.player, 2)
+
+        self.assertNotIn('display_name', data)
+        self.assertNotIn('country_code', data)
+        self.assertLess(len(data), len(pickle.dumps(self.player.__dict__, 2)))
+
+    def test_schema_changes_are_detected(self):
+        data = pickle.dumps(Ship({'name': 'Heart of Gold'}), 2)
+        Ship.append_field('crew', IntType())
+
+        with self.assertRaises(IncompatibleSchemaError):
+            pickle.loads(data)
+
+    def test_model_nesting_itself(self):
+        node = Node({'name': 'a', 'children': [{'name': 'b'}]})
+
+        for other in (pickle.loads(pickle.dumps(node, 2)), copy.deepcopy(node),
+                      copy.copy(node)):
+            self.assertEqual(other.serialize(), node.serialize())
+            self.assertEqual(other.children[0].name, 'b')
+
+    def test_ordered_dict(self):
+        d = OrderedDict([('b', 1), ('a', 2)])
+        d2 = pickle.loads(pickle.dumps(d, 2))
+
+        self.assertEqual(d2.items(), [('b', 1), ('a', 2)])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+import unittest
+
+from schematics.models import Model
+from schematics.types import StringType
+from schematics.types.compound import ListType, DictType
+from schematics.sampling import Sample
+from schematics.exceptions import ValidationError
+
+
+class Player(Model):
+    tags = ListType(StringType(max_length=2))
+    notes = DictType(StringType(max_length=2))
+
+
+class TestSample(unittest.TestCase):
+
+    def test_strategies(self):
+        self.assertEqual(Sample(first=3).indices(10), [0, 1, 2])
+        self.assertEqual(Sample(every=4).indices(10), [0, 4, 8])
+        self.assertEqual(Sample(first=2, every=4).indices(10), [0, 1, 4, 8])
+        self.assertEqual(Sample(first=20).indices(3), [0, 1, 2])
+
+        picked = Sample(random=3, seed=1).indices(1000)
+        self.assertEqual(len(picked), 3)
+        self.assertEqual(picked, Sample(random=3, seed=1).indices(1000))
+        self.assertNotEqual(picked, Sample(random=3, seed=2).indices(1000))
+
+    def test_needs_a_positive_strategy(self):
+        self.assertRaises(ValueError, Sample)
+        self.assertRaises(ValueError, Sample, seed=3)
+        self.assertRaises(ValueError, Sample, first=0)
+        self.assertRaises(ValueError, Sample, first=5, every=-1)
+        self.assertRaises(ValueError, Sample, random=0)
+
+    def test_pick_dict_keys(self):
+        sample = Sample(first=2)
+        self.assertEqual(sample.pick({'b': 1, 'c': 2, 'a': 3}), ['a', 'b'])
+
+
+class TestSampledValidation(unittest.TestCase):
+
+    def test_list_field(self):
+        field = ListType(StringType(max_length=2), sample=Sample(every=2))
+        items = [u'a', u'bcd', u'e', u'fgh', u'ijk']
+
+        with self.assertRaises(ValidationError) as context:
+            field.validate(items)
+        self.assertEqual(context.exception.messages,
+                         {4: [u'String value is too long.']})
+        self.assertEqual(field.sample.checked[field], [0, 2, 4])
+
+    def test_model_validate(self):
+        sample = Sample(first=2)
+        data = {
+            'tags': ['a', 'b', 'cde'],
+            'notes': {'x': 'a', 'y': 'b', 'z': 'cde'},
+        }
+
+        Player(data).validate(sample=sample)
+
+        self.assertEqual(sample.checked[Player.tags], [0, 1])
+        self.assertEqual(sample.checked[Player.notes], ['x', 'y'])
+
+        with self.assertRaises(ValidationError):
+            Player(data).validate()
+
+    def test_drop_invalid(self):
+        field = ListType(StringType(max_length=2), drop_invalid=True)
+        items = [u'abc', u'b', u'cde']
+
+        field.validate(items, sample=Sample(first=2))
+
+        self.assertEqual(items, [u'b', u'cde'])
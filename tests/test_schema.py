@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+import json
+import unittest
+
+from schematics.models import Model
+from schematics.types import StringType, IntType, DecimalType, DateTimeType
+from schematics.types.compound import ModelType, ListType, DictType
+from schematics.types.serializable import serializable
+from schematics.schema import describe, to_jsonschema
+
+
+class Location(Model):
+    country_code = StringType(required=True, regex='[A-Z]{2}',
+                              serialized_name='country')
+
+
+class Player(Model):
+    name = StringType(max_length=40)
+    level = IntType(min_value=1, choices=[1, 2, 3])
+    balance = DecimalType(min_value=0)
+    joined = DateTimeType()
+    home = ModelType(Location)
+    visited = ListType(ModelType(Location), min_size=1)
+    scores = DictType(IntType)
+
+    @serializable
+    def title(self):
+        return self.name
+
+
+class TestDescribe(unittest.TestCase):
+
+    def test_fields(self):
+        schema = describe(Player)
+        self.assertEqual([field.name for field in schema],
+                         ['name', 'level', 'balance', 'joined', 'home',
+                          'visited', 'scores'])
+        self.assertEqual(schema['name'].constraints, {'max_length': 40})
+        self.assertEqual(schema['level'].choices, [1, 2, 3])
+        self.assertEqual(schema['level'].json_type, 'integer')
+        self.assertEqual(schema['joined'].json_format, 'date-time')
+        self.assertEqual(schema['home'].model_class, Location)
+        self.assertEqual(schema['visited'].constraints, {'min_size': 1})
+        self.assertEqual(schema['visited'].item.model_class, Location)
+        self.assertIsNone(schema['visited'].model_class)
+        self.assertEqual(schema['scores'].item.type, 'IntType')
+        self.assertIn('title', schema)
+
+        location = describe(Location)['country_code']
+        self.assertEqual(location.serialized_name, 'country')
+        self.assertTrue(location.required)
+        self.assertEqual(location.constraints, {'regex': '[A-Z]{2}'})
+
+    def test_built_once_per_class(self):
+        self.assertIs(describe(Player), describe(Player))
+        self.assertIs(describe(Player), Player._schema)
+
+    def test_replaced_with_fields(self):
+        class Ship(Model):
+            name = StringType()
+
+        schema = describe(Ship)
+        Ship.append_field('crew', IntType())
+        self.assertIsNot(describe(Ship), schema)
+        self.assertEqual([field.name for field in describe(Ship)],
+                         ['name', 'crew'])
+
+        del Ship().crew
+        self.assertNotIn('crew', describe(Ship))
+
+
+class TestJSONSchema(unittest.TestCase):
+
+    def test_export(self):
+        schema = to_jsonschema(Player)
+        self.assertEqual(schema['title'], 'Player')
+        self.assertEqual(schema['type'], 'object')
+        self.assertNotIn('required', schema)
+
+        properties = schema['properties']
+        self.assertEqual(properties['name'],
+                         {'type': ['string', 'null'], 'maxLength': 40})
+        self.assertEqual(properties['level'],
+                         {'type': ['integer', 'null'], 'enum': [1, 2, 3],
+                          'minimum': 1})
+        # serialized as a string, so there's no numeric minimum
+        self.assertEqual(properties['balance'], {'type': ['string', 'null']})
+        self.assertEqual(properties['home'],
+                         {'anyOf': [{'$ref': '#/definitions/Location'},
+                                    {'type': 'null'}]})
+        self.assertEqual(properties['visited']['minItems'], 1)
+        self.assertEqual(properties['scores']['additionalProperties'],
+                         {'type': ['integer', 'null']})
+        self.assertEqual(properties['title'], {})
+
+        self.assertEqual(schema['definitions'].keys(), ['Location'])
+        self.assertEqual(schema['definitions']['Location'], {
+            'type': 'object',
+            'properties': {'country': {'type': 'string',
+                                       'pattern': '^(?:[A-Z]{2})'}},
+            'required': ['country'],
+        })
+
+        json.dumps(schema)
+
+    def test_cached_until_nested_model_changes(self):
+        class Crew(Model):
+            name = StringType()
+
+        class Ship(Model):
+            captain = ModelType(Crew)
+
+        schema = to_jsonschema(Ship)
+        self.assertIs(to_jsonschema(Ship), schema)
+
+        Crew.append_field('rank', StringType())
+        schema = to_jsonschema(Ship)
+        self.assertIn('rank', schema['definitions']['Crew']['properties'])
+
+    def test_recursive_model(self):
+        class Node(Model):
+            value = IntType()
+
+        Node.append_field('children', ListType(ModelType(Node)))
+        schema = to_jsonschema(Node)
+        self.assertNotIn('definitions', schema)
+        self.assertEqual(schema['properties']['children']['items'],
+                         {'anyOf': [{'$ref': '#'}, {'type': 'null'}]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 # encoding=utf-8
 
+import json
 import unittest
+from StringIO import StringIO
 
 from schematics.models import Model
 from schematics.types import StringType, LongType, IntType
@@ -740,3 +742,60 @@ class TestRoles(unittest.TestCase):
         self.assertEqual(d, {
             "name": "Player2"
         })
+
+
+class TestToJSON(unittest.TestCase):
+
+    def setUp(self):
+        class Location(Model):
+            country_code = StringType()
+            secret = StringType()
+
+            class Options:
+                roles = {"public": whitelist("country_code")}
+
+        class Player(Model):
+            id = IntType()
+            display_name = StringType(serialized_name="displayName")
+            nickname = StringType(serialize_when_none=False)
+            location = ModelType(Location)
+            visits = ListType(ModelType(Location))
+            scores = DictType(IntType)
+            tags = ListType(StringType())
+
+            class Options:
+                roles = {"public": whitelist("display_name", "location", "visits")}
+
+            @serializable
+            def title(self):
+                return u"Captain %s" % self.display_name
+
+        self.Player = Player
+        self.player = Player({
+            "id": 1,
+            "displayName": u"J\xf6kull \"J\"",
+            "location": {"country_code": "IS", "secret": "x"},
+            "visits": [{"country_code": "US"}, {"country_code": "GB", "secret": "y"}],
+            "scores": {"math": 10, "art": 3},
+            "tags": ["a", "b"],
+        })
+
+    def test_matches_serialize(self):
+        self.assertEqual(json.loads(self.player.to_json()), self.player.serialize())
+
+    def test_matches_serialize_with_role(self):
+        self.assertEqual(json.loads(self.player.to_json(role="public")),
+                         self.player.serialize(role="public"))
+
+    def test_empty_model(self):
+        player = self.Player()
+        self.assertEqual(json.loads(player.to_json()), player.serialize())
+
+    def test_writes_to_stream(self):
+        stream = StringIO()
+        self.assertIsNone(self.player.to_json(stream=stream))
+        self.assertEqual(json.loads(stream.getvalue()), self.player.serialize())
+
+    def test_unknown_role(self):
+        with self.assertRaises(ValueError):
+            self.player.to_json(role="private")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+
+from schematics.models import Model
+from schematics.types import StringType, IntType, DateTimeType
+from schematics.types.compound import ModelType, ListType
+from schematics.store import RecordStore
+from schematics.exceptions import IncompatibleSchemaError
+
+
+class Location(Model):
+    country_code = StringType()
+
+
+class Player(Model):
+    name = StringType()
+    level = IntType()
+    joined = DateTimeType()
+    home = ModelType(Location)
+    scores = ListType(IntType())
+
+
+class Ship(Model):
+    name = StringType()
+
+
+class TestRecordStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'players.db')
+        self.players = [
+            Player({'name': u'Arthur', 'level': 4,
+                    'joined': datetime.datetime(2013, 3, 7, 15, 31),
+                    'home': {'country_code': 'GB'}, 'scores': [1, 2]}),
+            Player({'name': u'Ford'}),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_append_and_read(self):
+        with RecordStore(Player, self.path, 'a') as store:
+            self.assertEqual(store.append(self.players[0]), 0)
+            self.assertEqual(store.append(self.players[1]), 1)
+
+        store = RecordStore(Player, self.path)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.field(0, 'name'), u'Arthur')
+        self.assertEqual(store.field(1, 'level'), None)
+        self.assertEqual(store.row(0)['scores'], [1, 2])
+        self.assertEqual(list(store), self.players)
+        self.assertEqual(store[-1].name, u'Ford')
+        store.close()
+
+    def test_views_decode_fields_on_access(self):
+        with RecordStore(Player, self.path, 'a') as store:
+            store.extend(self.players)
+            player = store[0]
+
+            self.assertEqual(player._raw_data._values, {})
+            self.assertEqual(player.level, 4)
+            self.assertEqual(player._raw_data._values, {'level': 4})
+
+            player.level = 5
+            self.assertEqual(player.level, 5)
+            self.assertEqual(store.field(0, 'level'), 4)
+            self.assertEqual(player.serialize()['home'], {'country_code': 'GB'})
+
+    def test_readers_see_appended_records(self):
+        writer = RecordStore(Player, self.path, 'a')
+        reader = RecordStore(Player, self.path)
+        self.assertEqual(len(reader), 0)
+
+        writer.append(self.players[0])
+        reader.refresh()
+        self.assertEqual(len(reader), 1)
+
+        # a record that is only partly written is left out
+        with open(self.path, 'ab') as f:
+            f.write('\x00\x00\x00\xff\x00')
+        reader.refresh()
+        self.assertEqual(len(reader), 1)
+
+        with self.assertRaises(IndexError):
+            reader.field(1, 'name')
+        with self.assertRaises(IOError):
+            reader.append(self.players[1])
+        writer.close()
+        reader.close()
+
+    def test_model_nesting_itself(self):
+        class Node(Model):
+            name = StringType()
+
+        Node.append_field('children', ListType(ModelType(Node)))
+        node = Node({'name': 'a', 'children': [{'name': 'b'}]})
+
+        with RecordStore(Node, self.path, 'a') as store:
+            store.append(node)
+        with RecordStore(Node, self.path) as store:
+            self.assertEqual(store[0].children[0].name, 'b')
+
+    def test_incompatible_schema(self):
+        RecordStore(Player, self.path, 'a').close()
+
+        with self.assertRaises(IncompatibleSchemaError):
+            RecordStore(Ship, self.path)
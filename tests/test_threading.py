@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+import unittest
+from multiprocessing.pool import ThreadPool
+
+from schematics.models import Model
+from schematics.types import IntType, StringType
+from schematics.types.compound import ModelType, ListType
+
+
+class Location(Model):
+    country_code = StringType()
+
+
+class Player(Model):
+    id = IntType()
+    name = StringType()
+    locations = ListType(ModelType(Location))
+
+
+class TestConcurrency(unittest.TestCase):
+
+    def test_serialize_does_not_change_the_instance(self):
+        player = Player({'id': '1', 'name': 'Arthur'})
+        raw_data, data = player._raw_data, player._data
+
+        player.serialize()
+
+        self.assertIs(player._raw_data, raw_data)
+        self.assertIs(player._data, data)
+        self.assertEqual(player._data, {})
+
+    def test_serialize_does_not_change_nested_models(self):
+        player = Player({'id': '1', 'locations': [{'country_code': 'IS'}]})
+        location = player.locations[0]
+        raw_data, data = location._raw_data, location._data
+
+        self.assertEqual(player.serialize()['locations'],
+                         [{'country_code': u'IS'}])
+
+        self.assertIs(location._raw_data, raw_data)
+        self.assertIs(location._data, data)
+        self.assertEqual(raw_data, {'country_code': u'IS'})
+
+    def test_validate_async_replaces_the_data(self):
+        player = Player({'id': '1'})
+        raw_data, data = player._raw_data, player._data
+
+        player.validate_async({'name': 'Arthur'}).result(timeout=5)
+
+        self.assertEqual(raw_data, {'id': 1, 'name': None, 'locations': None})
+        self.assertEqual(data, {})
+        self.assertEqual(player._data['name'], 'Arthur')
+
+    def test_append_field_replaces_the_field_table(self):
+        class User(Model):
+            name = StringType()
+
+        fields = User._fields
+        User.append_field('email', StringType())
+
+        self.assertEqual(fields.keys(), ['name'])
+        self.assertEqual(User._fields.keys(), ['name', 'email'])
+
+    def test_shared_instances_and_classes(self):
+        class Account(Model):
+            id = IntType()
+            name = StringType()
+            players = ListType(ModelType(Player))
+
+        account = Account({
+            'id': 42,
+            'name': 'Guide',
+            'players': [
+                {'id': i, 'name': 'Player %d' % i, 'locations': [{'country_code': 'is'}]}
+                for i in range(20)
+            ],
+        })
+        expected = account.serialize()
+
+        def work(i):
+            if i % 10 == 0:
+                Account.append_field('extra_%d' % i, StringType())
+            if i % 3 == 0:
+                Account({'id': i, 'name': 'Other'}).validate()
+            data = account.serialize()
+            return dict((k, v) for k, v in data.items() if not k.startswith('extra_'))
+
+        pool = ThreadPool(8)
+        try:
+            results = pool.map(work, range(500))
+        finally:
+            pool.close()
+            pool.join()
+
+        for result in results:
+            self.assertEqual(result, expected)
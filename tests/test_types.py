@@ -1,11 +1,17 @@
 
 import unittest
 import datetime
+import decimal
+import uuid
+import time
+import random
 
 from schematics.types import (
     BaseType, StringType, DateTimeType, DateType, IntType, EmailType, LongType,
-    URLType, BooleanType,
+    URLType, BooleanType, DecimalType, UUIDType, UUIDBytes, MD5Type, IPv4Type,
+    UTC,
 )
+from schematics.types.temporal import TimeStampType
 from schematics.exceptions import ValidationError, StopValidation, ConversionError
 
 
@@ -113,12 +119,47 @@ class TestEmailType(unittest.TestCase):
         with self.assertRaises(ValidationError):
             EmailType().validate(u'sdfg\U0001f636\U0001f46e')
 
+    def test_valid_email_matches_regex(self):
+        emails = [
+            'a@b.com', 'a.b@c.co.uk', "o'neil@x.org", 'a@b.com.', '"a@b"@c.com',
+            '"a b"@c.com', 'a@b@c.com', '@b.com', 'a@', 'a', 'a..b@c.com',
+            '.a@c.com', 'a@b.c', 'a@-b.com', 'a b@c.com', '"a@b.com',
+        ]
+        for email in emails:
+            self.assertEqual(EmailType.valid_email(email),
+                             EmailType.EMAIL_REGEX.match(email) is not None, email)
+
 
 class TestURLType(unittest.TestCase):
     def test_url_type_with_invalid_url(self):
         with self.assertRaises(ValidationError):
             URLType().validate(u'http:example.com')
 
+    def test_valid_url_matches_regex(self):
+        urls = [
+            'http://example.com', 'https://example.com/', 'HTTPS://EXAMPLE.COM/a',
+            'http://example.com?a=1', 'http://localhost:8000/x', 'http://1.2.3.4:80',
+            'http://a.com.', 'http://a.com//', 'https://a.co?q', 'http://a.com/#f',
+            'http://example.com?', 'http://localhost/x y', 'ftp://example.com',
+            'http://example', 'http://ex_ample.com', 'http://example.com#f',
+            'http://-a.com', 'http://a.com..', 'http://', 'http://a.com:/', '',
+            'http://localhost\n?-', 'http://1.2.3.4\n/', 'http://a.com\n',
+            'http://a.com/\n',
+        ]
+        for url in urls:
+            self.assertEqual(URLType.valid_url(url),
+                             URLType.URL_REGEX.match(url) is not None, url)
+
+    def test_valid_url_matches_regex_on_random_urls(self):
+        rnd = random.Random(1)
+        schemes = ['http://', 'https://', 'HTTP://', 'ftp://', '']
+        hosts = ['localhost', '1.2.3.4', 'example.com', 'a-b.com.', '']
+        for _ in range(5000):
+            url = rnd.choice(schemes) + rnd.choice(hosts) + ''.join(
+                rnd.choice('aZ0-._:/?# \n') for _ in range(rnd.randint(0, 5)))
+            self.assertEqual(URLType.valid_url(url),
+                             URLType.URL_REGEX.match(url) is not None, repr(url))
+
 
 class TestLongType(unittest.TestCase):
 
@@ -128,6 +169,156 @@ class TestLongType(unittest.TestCase):
             field.convert(None)
 
 
+class TestDecimalType(unittest.TestCase):
+
+    def test_convert(self):
+        field = DecimalType()
+
+        self.assertEqual(field(12), decimal.Decimal('12'))
+        self.assertEqual(field(1.1), decimal.Decimal('1.1'))
+        self.assertEqual(field(u'1.10'), decimal.Decimal('1.10'))
+        self.assertEqual(field.to_primitive(field(u'1.10')), u'1.10')
+
+        with self.assertRaises(ConversionError):
+            field('one')
+        with self.assertRaises(ConversionError):
+            field(True)
+
+    def test_quantize(self):
+        field = DecimalType(places=2)
+
+        self.assertEqual(str(field(u'1.005')), '1.00')
+        self.assertEqual(str(field(3)), '3.00')
+        self.assertEqual(field.to_primitive(field(u'2.5')), u'2.50')
+
+        field = DecimalType(places=2, rounding=decimal.ROUND_HALF_UP)
+        self.assertEqual(str(field(u'1.005')), '1.01')
+
+    def test_minor_units(self):
+        field = DecimalType(places=2, serialize_as='minor_units',
+                            read_minor_units=False)
+
+        self.assertEqual(field.to_primitive(field(u'12.34')), 1234)
+        for value in (1234, u'1234', 1234.0):
+            self.assertEqual(field(value), decimal.Decimal('1234.00'))
+
+        field = DecimalType(places=2, serialize_as='minor_units')
+        self.assertTrue(field.read_minor_units)
+        for value in (1234, u'1234', 1234.0):
+            self.assertEqual(field(value), decimal.Decimal('12.34'))
+        self.assertEqual(field(decimal.Decimal('12.34')), decimal.Decimal('12.34'))
+        self.assertEqual(field(field.to_primitive(field(99))), decimal.Decimal('0.99'))
+
+        with self.assertRaises(ValueError):
+            DecimalType(read_minor_units=True)
+        with self.assertRaises(ValueError):
+            DecimalType(serialize_as='minor_units')
+        with self.assertRaises(ValueError):
+            DecimalType(serialize_as='float')
+
+    def test_range(self):
+        field = DecimalType(min_value=0, max_value=10)
+        field.validate(decimal.Decimal('5'))
+
+        with self.assertRaises(ValidationError):
+            field.validate(decimal.Decimal('-1'))
+
+
+class TestUUIDType(unittest.TestCase):
+
+    value = uuid.UUID('12345678-1234-5678-1234-567812345678')
+
+    def test_convert(self):
+        field = UUIDType()
+
+        self.assertEqual(field(str(self.value)), self.value)
+        self.assertEqual(field(self.value.hex), self.value)
+        with self.assertRaises(ConversionError):
+            field('12345678')
+
+    def test_compact(self):
+        field = UUIDType(compact=True)
+
+        for value in (self.value, str(self.value), self.value.urn,
+                      '{%s}' % self.value, UUIDBytes(self.value.bytes)):
+            self.assertEqual(field(value), self.value.bytes)
+            self.assertIsInstance(field(value), UUIDBytes)
+        self.assertEqual(field.to_primitive(self.value.bytes), str(self.value))
+
+        for value in ('x' * 32, 'not-a-uuid-at-al', self.value.bytes):
+            with self.assertRaises(ConversionError):
+                field(value)
+
+    def test_convert_many(self):
+        field = UUIDType()
+
+        self.assertEqual(field.convert_many([str(self.value)]), [self.value])
+        with self.assertRaises(ConversionError) as context:
+            field.convert_many([str(self.value), 'nope', 1])
+        self.assertEqual(sorted(context.exception.messages), [1, 2])
+
+    def test_invalid_indices(self):
+        values = [str(self.value), 'nope', self.value, None, 'g' * 32]
+        self.assertEqual(UUIDType.invalid_indices(values), [1, 3, 4])
+
+
+class TestHashType(unittest.TestCase):
+
+    def test_convert_many(self):
+        md5 = 'd41d8cd98f00b204e9800998ecf8427e'
+        self.assertEqual(MD5Type().convert_many([md5]), [int(md5, 16)])
+
+        with self.assertRaises(ConversionError) as context:
+            MD5Type().convert_many([md5, 'abc', 'z' * 32])
+        self.assertEqual(sorted(context.exception.messages), [1, 2])
+
+    def test_integers(self):
+        field = MD5Type()
+        self.assertEqual(field(0), 0)
+        self.assertEqual(field(16 ** 32 - 1), 16 ** 32 - 1)
+
+        for value in (-1, True, 16 ** 32, 2 ** 200, 1.5):
+            with self.assertRaises(ConversionError):
+                field(value)
+
+    def test_invalid_indices(self):
+        values = ['d41d8cd98f00b204e9800998ecf8427e', 'abc', 'D41D8CD98F00B204E9800998ECF8427Z', None]
+        self.assertEqual(MD5Type.invalid_indices(values), [1, 2, 3])
+
+
+class TestIPv4Type(unittest.TestCase):
+
+    def test_validate(self):
+        field = IPv4Type()
+
+        for addr in ('0.0.0.0', '192.168.1.255', ' 10.0.0.1 ', '010.0.0.1'):
+            field.validate(addr)
+
+        for addr in ('256.0.0.1', '1.2.3', '1.2.3.4.5', '-1.2.3.4', 'a.b.c.d', None, 1):
+            with self.assertRaises(ValidationError):
+                field.validate(addr)
+
+    def test_packed(self):
+        field = IPv4Type(packed=True)
+
+        value = field('192.168.1.10')
+        self.assertEqual(value, 0xc0a8010a)
+        field.validate(value)
+        self.assertEqual(field.to_primitive(value), u'192.168.1.10')
+
+        with self.assertRaises(ValidationError):
+            field.validate(field('192.168.1.300'))
+        with self.assertRaises(ValidationError):
+            field.validate(2 ** 32)
+
+    def test_in_network(self):
+        self.assertTrue(IPv4Type.in_network('10.1.2.3', '10.0.0.0/8'))
+        self.assertTrue(IPv4Type.in_network(0x0a010203, '10.0.0.0/8'))
+        self.assertFalse(IPv4Type.in_network('11.1.2.3', '10.0.0.0/8'))
+        self.assertTrue(IPv4Type.in_network('10.1.2.3', '10.1.2.3'))
+        self.assertTrue(IPv4Type.in_network('8.8.8.8', '0.0.0.0/0'))
+
+
 class TestStringType(unittest.TestCase):
     def test_string_type_required(self):
         field = StringType(required=True)
@@ -152,3 +343,138 @@ class TestStringType(unittest.TestCase):
 
         with self.assertRaises(ValidationError):
             StringType(regex='\d+').validate("a")
+
+
+class TestDateTimeType(unittest.TestCase):
+
+    def test_parses_iso_datetimes(self):
+        field = DateTimeType()
+
+        self.assertEqual(field('2013-03-07T15:31:02'),
+                         datetime.datetime(2013, 3, 7, 15, 31, 2))
+        self.assertEqual(field('2013-03-07T15:31:02.5'),
+                         datetime.datetime(2013, 3, 7, 15, 31, 2, 500000))
+        self.assertEqual(field('2013-03-07T15:31:02.000123'),
+                         datetime.datetime(2013, 3, 7, 15, 31, 2, 123))
+
+    def test_aware_datetimes_round_trip(self):
+        field = DateTimeType()
+        for value, serialized in (
+                ('2013-03-07T15:31:02+05:30', '2013-03-07T15:31:02.000000+05:30'),
+                ('2013-03-07T15:31:02-08:00', '2013-03-07T15:31:02.000000-08:00'),
+                ('2013-03-07T15:31:02Z', '2013-03-07T15:31:02.000000Z')):
+            dt = field(value)
+            self.assertEqual(field.to_primitive(dt), serialized)
+            self.assertEqual(field(field.to_primitive(dt)), dt)
+
+        naive = datetime.datetime(2013, 3, 7, 15, 31, 2)
+        self.assertEqual(field.to_primitive(naive), '2013-03-07T15:31:02.000000')
+
+    def test_parses_iso_timezones(self):
+        field = DateTimeType()
+
+        utc = field('2013-03-07T15:31:02Z')
+        self.assertEqual(utc.utcoffset(), datetime.timedelta(0))
+
+        offset = field('2013-03-07T15:31:02.25+05:30')
+        self.assertEqual(offset.utcoffset(), datetime.timedelta(hours=5, minutes=30))
+        self.assertEqual(offset, utc.replace(microsecond=250000) -
+                         datetime.timedelta(hours=5, minutes=30))
+
+        self.assertEqual(field('2013-03-07T15:31:02-0800').tzname(), '-08:00')
+
+        for value in ('2013-01-01T00:00:00+99:00', '2013-01-01T00:00:00-05:60'):
+            with self.assertRaises(ConversionError):
+                field(value)
+
+    def test_falls_back_to_formats(self):
+        # strptime accepts unpadded values
+        self.assertEqual(DateTimeType()('2013-3-7T15:31:02'),
+                         datetime.datetime(2013, 3, 7, 15, 31, 2))
+
+        with self.assertRaises(ConversionError):
+            DateTimeType()('2013-02-30T15:31:02')
+        with self.assertRaises(ConversionError):
+            DateTimeType()(None)
+
+    def test_custom_formats_skip_iso_parser(self):
+        field = DateTimeType(formats='%Y.%m.%d %H:%M')
+
+        self.assertEqual(field.formats, ['%Y.%m.%d %H:%M'])
+        with self.assertRaises(ConversionError):
+            field('2013-03-07T15:31:02')
+
+    def test_to_primitive_matches_strftime(self):
+        field = DateTimeType()
+        for dt in [datetime.datetime(2013, 3, 7, 15, 31, 2),
+                   datetime.datetime(1999, 12, 31, 23, 59, 59, 999999),
+                   datetime.datetime(2013, 3, 7, 1, 2, 3, 4000, UTC)]:
+            # plus the UTC offset of aware datetimes
+            self.assertEqual(field.to_primitive(dt),
+                             dt.strftime(DateTimeType.SERIALIZED_FORMAT) +
+                             ('Z' if dt.tzinfo else ''))
+
+
+class TestDateType(unittest.TestCase):
+
+    def test_parses_iso_dates(self):
+        self.assertEqual(DateType()('2013-03-01'), datetime.date(2013, 3, 1))
+        self.assertEqual(DateType()('2013-3-1'), datetime.date(2013, 3, 1))
+
+        with self.assertRaises(ConversionError):
+            DateType()('2013-02-30')
+
+    def test_to_primitive_matches_strftime(self):
+        field = DateType()
+        for value in [datetime.date(2013, 3, 1), datetime.date(1999, 12, 31),
+                      datetime.datetime(2013, 3, 1, 12, 30)]:
+            self.assertEqual(field.to_primitive(value), value.strftime('%Y-%m-%d'))
+            # memoized
+            self.assertEqual(field.to_primitive(value), value.strftime('%Y-%m-%d'))
+
+
+class TestTimeStampType(unittest.TestCase):
+
+    def test_converts_timestamps_to_utc(self):
+        dt = TimeStampType()(1362670262)
+
+        self.assertEqual(dt, datetime.datetime(2013, 3, 7, 15, 31, 2, tzinfo=UTC))
+        self.assertEqual(dt.utcoffset(), datetime.timedelta(0))
+        self.assertEqual(TimeStampType()('1362670262.5').microsecond, 500000)
+
+        with self.assertRaises(ConversionError):
+            TimeStampType()(-1)
+
+    def test_to_primitive(self):
+        dt = datetime.datetime(2013, 3, 7, 15, 31, 2, 999999, tzinfo=UTC)
+        self.assertEqual(TimeStampType().to_primitive(dt), 1362670262)
+
+        offset = TimeStampType()('2013-03-07T17:31:02+02:00')
+        self.assertEqual(TimeStampType().to_primitive(offset), 1362670262)
+
+    def test_naive_datetimes_are_local_time(self):
+        dt = datetime.datetime(2013, 3, 7, 15, 31, 2)
+        self.assertEqual(TimeStampType().to_primitive(dt),
+                         int(time.mktime(dt.timetuple())))
+
+    def test_precision(self):
+        field = TimeStampType(precision='ms')
+        dt = field(1362670262123)
+
+        self.assertEqual(dt.microsecond, 123000)
+        self.assertEqual(field.to_primitive(dt), 1362670262123)
+
+        field = TimeStampType(precision='us')
+        self.assertEqual(field.to_primitive(field(1362670262123456)), 1362670262123456)
+
+        with self.assertRaises(ValueError):
+            TimeStampType(precision='ns')
+
+    def test_out_of_range(self):
+        for value in (1e12, 1e20, '99999999999999'):
+            with self.assertRaises(ConversionError):
+                TimeStampType()(value)
+
+    def test_formats_stay_the_first_argument(self):
+        field = TimeStampType(['%Y-%m-%d'])
+        self.assertEqual(field('2013-03-07'), datetime.datetime(2013, 3, 7))
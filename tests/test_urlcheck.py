@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+import threading
+import unittest
+from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from SocketServer import ThreadingMixIn
+
+from schematics.models import Model
+from schematics.types import URLType
+from schematics.types.compound import ListType
+from schematics.types.urlcheck import (
+    URLChecker, ConnectionPool, head_request, default_pool,
+)
+from schematics.exceptions import ValidationError
+
+
+class StubServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keeps connections open
+    connections = 0
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        StubHandler.connections += 1
+
+    def do_HEAD(self):
+        if self.path.startswith('/get-only'):
+            self.respond(405)
+        else:
+            self.respond(200 if self.path.startswith('/ok') else 404)
+
+    def do_GET(self):
+        self.respond(200 if self.path.startswith('/get-only') else 404)
+
+    def respond(self, status):
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHeadRequest(unittest.TestCase):
+
+    def setUp(self):
+        StubHandler.connections = 0
+        self.server = StubServer(('localhost', 0), StubHandler)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.base_url = 'http://localhost:%d' % self.server.server_port
+
+    def tearDown(self):
+        default_pool.clear()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_head_request(self):
+        self.assertTrue(head_request(self.base_url + '/ok', 1))
+        self.assertTrue(head_request(self.base_url + '/ok?again', 1))
+        self.assertFalse(head_request(self.base_url + '/missing', 1))
+        self.assertFalse(head_request('http://localhost:1/ok', 1))
+
+    def test_falls_back_to_get(self):
+        self.assertTrue(head_request(self.base_url + '/get-only', 1))
+
+    def test_connections_are_reused_across_threads(self):
+        pool = ConnectionPool()
+        head_request(self.base_url + '/ok', 1, pool)
+        thread = threading.Thread(target=head_request,
+                                  args=(self.base_url + '/ok/2', 1, pool))
+        thread.start()
+        thread.join()
+        pool.clear()
+
+        self.assertEqual(StubHandler.connections, 1)
+
+    def test_pool_is_bounded(self):
+        pool = ConnectionPool(max_idle_per_host=1)
+        key = ('http', 'localhost')
+        first, second = pool.connect(key, 1), pool.connect(key, 1)
+        pool.put(key, first)
+        pool.put(key, second)
+
+        self.assertIs(pool.get(key, 1), first)
+        self.assertIsNot(pool.get(key, 1), second)
+
+    def test_list_of_urls(self):
+        class Page(Model):
+            links = ListType(URLType(verify_exists=True, checker=URLChecker()))
+
+        page = Page({'links': [self.base_url + '/ok/%d' % i for i in range(5)]})
+        page.validate()
+
+        page = Page({'links': [self.base_url + '/ok', self.base_url + '/missing']})
+        with self.assertRaises(ValidationError):
+            page.validate()
+
+
+class TestURLChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.requested = []
+
+        def resolver(url, timeout):
+            self.requested.append(url)
+            if 'error' in url:
+                raise IOError()
+            return 'missing' not in url
+
+        self.checker = URLChecker(resolver=resolver)
+
+    def test_results_are_cached(self):
+        self.assertTrue(self.checker.exists('http://a.com/'))
+        self.assertTrue(self.checker.exists('http://a.com/'))
+        self.assertFalse(self.checker.exists('http://a.com/missing'))
+        self.assertFalse(self.checker.exists('http://a.com/error'))
+        self.assertEqual(len(self.requested), 3)
+
+        self.checker.clear()
+        self.checker.exists('http://a.com/')
+        self.assertEqual(len(self.requested), 4)
+
+    def test_cache_expires(self):
+        self.checker.cache_ttl = 0
+        self.checker.exists('http://a.com/')
+        self.checker.exists('http://a.com/')
+        self.assertEqual(len(self.requested), 2)
+
+    def test_exists_many(self):
+        urls = ['http://a.com/%d' % i for i in range(20)] + ['http://a.com/missing']
+        results = self.checker.exists_many(urls + urls[:2])
+
+        self.assertEqual(results, [True] * 20 + [False] + [True] * 2)
+        self.assertEqual(sorted(self.requested), sorted(urls))
+
+    def test_url_type_prefetches_items(self):
+        field = ListType(URLType(verify_exists=True, checker=self.checker))
+        urls = ['http://a.com/1', 'http://a.com/2', 'not a url']
+
+        with self.assertRaises(ValidationError):
+            field.validate(urls)
+        self.assertEqual(sorted(self.requested), urls[:2])
@@ -2,6 +2,8 @@
 
 import unittest
 import datetime
+import threading
+import time
 
 from schematics.models import Model
 from schematics.exceptions import (
@@ -11,6 +13,7 @@ from schematics.exceptions import (
 from schematics.types import StringType, DateTimeType, BooleanType
 from schematics.types.compound import ModelType, ListType, DictType
 from schematics.types.serializable import serializable
+from schematics.deferred import Future
 
 
 class TestChoices(unittest.TestCase):
@@ -253,15 +256,15 @@ class TestErrors(unittest.TestCase):
         messages = exception.messages
 
         self.assertEqual(messages, {
-            'courses': [
-                {
-                    'attending': [
-                        {
+            'courses': {
+                0: {
+                    'attending': {
+                        0: {
                             'name': [u'This field is required.']
                         }
-                    ]
+                    }
                 }
-            ]
+            }
         })
 
     def test_deep_errors_with_dicts(self):
@@ -306,11 +309,11 @@ class TestErrors(unittest.TestCase):
             'courses': {
                 "ENG103":
                 {
-                    'attending': [
-                        {
+                    'attending': {
+                        0: {
                             'name': [u'This field is required.']
                         }
-                    ]
+                    }
                 }
             }
         })
@@ -379,3 +382,148 @@ class TestBuiltinExceptions(unittest.TestCase):
             raise ValidationError('ValueError')
         with self.assertRaises(ValueError):
             raise ModelValidationError('ValueError')
+
+
+def delayed(seconds, error=None):
+    """Returns a future that fails with ``error`` or succeeds after a delay."""
+    future = Future()
+
+    def finish():
+        if error:
+            future.set_exception(ValidationError(error))
+        else:
+            future.set_result(None)
+
+    threading.Timer(seconds, finish).start()
+    return future
+
+
+class TestAsyncValidation(unittest.TestCase):
+
+    def test_async_field_validators_run_concurrently(self):
+        calls = []
+
+        def unique(value, *args):
+            calls.append(value)
+            return delayed(0.2, u'Taken.' if value == 'taken' else None)
+
+        class Signup(Model):
+            username = StringType(validators=[unique])
+            email = StringType(validators=[unique])
+            name = StringType(required=True)
+
+        signup = Signup({'username': 'arthur', 'email': 'a@b.com', 'name': 'Arthur'})
+
+        start = time.time()
+        result = signup.validate_async()
+        self.assertEqual(sorted(calls), ['a@b.com', 'arthur'])
+        self.assertIsNone(result.result(timeout=5))
+        self.assertLess(time.time() - start, 0.35)
+        self.assertEqual(signup.username, 'arthur')
+
+    def test_async_errors_are_aggregated(self):
+        def unique(value, *args):
+            return delayed(0.01, u'Taken.')
+
+        class Signup(Model):
+            username = StringType(validators=[unique])
+            name = StringType(required=True)
+
+        result = Signup({'username': 'taken'}).validate_async()
+
+        with self.assertRaises(ModelValidationError) as context:
+            result.result(timeout=5)
+
+        self.assertEqual(context.exception.messages, {
+            'username': [u'Taken.'],
+            'name': [u'This field is required.'],
+        })
+
+    def test_async_unexpected_errors_are_passed_on(self):
+        def lookup(value, *args):
+            future = Future()
+            threading.Timer(0.01, future.set_exception, [IOError('db down')]).start()
+            return future
+
+        class Signup(Model):
+            username = StringType(validators=[lookup])
+
+        result = Signup({'username': 'arthur'}).validate_async()
+        with self.assertRaises(IOError):
+            result.result(timeout=5)
+
+    def test_async_item_validators_are_not_waited_for(self):
+        def unique(value, *args):
+            return delayed(0.2, u'Taken.' if value == 'taken' else None)
+
+        class Signup(Model):
+            usernames = ListType(StringType(validators=[unique]))
+            aliases = ListType(StringType(validators=[unique]), drop_invalid=True)
+
+        signup = Signup({'usernames': ['arthur', 'taken', 'ford'],
+                         'aliases': ['taken', 'zaphod']})
+
+        start = time.time()
+        result = signup.validate_async()
+        self.assertFalse(result.done())
+
+        with self.assertRaises(ModelValidationError) as context:
+            result.result(timeout=5)
+        self.assertLess(time.time() - start, 0.35)
+        self.assertEqual(context.exception.messages,
+                         {'usernames': {1: [u'Taken.']}})
+
+        signup = Signup({'aliases': ['taken', 'zaphod']})
+        signup.validate_async().result(timeout=5)
+        self.assertEqual(signup.aliases, ['zaphod'])
+
+    def test_async_nested_model_validators(self):
+        def unique(value, *args):
+            return delayed(0.2, u'Taken.' if value == 'taken' else None)
+
+        class Account(Model):
+            owner = StringType(validators=[unique])
+
+        class Signup(Model):
+            account = ModelType(Account)
+            accounts = DictType(ModelType(Account))
+
+        signup = Signup({'account': {'owner': 'taken'},
+                         'accounts': {'a': {'owner': 'arthur'},
+                                      'b': {'owner': 'taken'}}})
+        result = signup.validate_async()
+        self.assertFalse(result.done())
+
+        with self.assertRaises(ModelValidationError) as context:
+            result.result(timeout=5)
+        self.assertEqual(context.exception.messages, {
+            'account': {'owner': [u'Taken.']},
+            'accounts': {'b': {'owner': [u'Taken.']}},
+        })
+
+    def test_async_model_validators(self):
+        class Account(Model):
+            owner = StringType()
+
+            def validate_owner(self, data, value):
+                return delayed(0.01, u'Unknown owner.' if value == 'nobody' else None)
+
+        self.assertNotIn('async', Account._validator_functions)
+
+        Account({'owner': 'arthur'}).validate_async().result(timeout=5)
+
+        result = Account({'owner': 'nobody'}).validate_async()
+        with self.assertRaises(ModelValidationError) as context:
+            result.result(timeout=5)
+        self.assertEqual(context.exception.messages, {'owner': [u'Unknown owner.']})
+
+    def test_sync_validate_waits_for_futures(self):
+        def unique(value, *args):
+            return delayed(0.01, u'Taken.')
+
+        class Signup(Model):
+            username = StringType(validators=[unique])
+
+        with self.assertRaises(ModelValidationError) as context:
+            Signup({'username': 'taken'}).validate()
+        self.assertEqual(context.exception.messages, {'username': [u'Taken.']})